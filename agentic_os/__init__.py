@@ -1,7 +1,20 @@
 # @file purpose: Public API for the Agentic OS tools system.
 """Exports tool registration helpers and registry access."""
 
-from .tools import ToolSpec, get_registry, register_spec
-from .memory import MemoryStore
+from typing import TYPE_CHECKING
 
-__all__ = ["ToolSpec", "register_spec", "get_registry", "MemoryStore"]
+from .tools import ToolSpec, get_registry, get_spec, register_lazy, register_spec
+
+if TYPE_CHECKING:
+	from .memory import MemoryStore
+
+__all__ = ["ToolSpec", "register_spec", "register_lazy", "get_registry", "get_spec", "MemoryStore"]
+
+
+def __getattr__(name: str):
+	# MemoryStore is only needed by memory backends, so import it on first access (PEP 562)
+	if name == "MemoryStore":
+		from .memory import MemoryStore
+
+		return MemoryStore
+	raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
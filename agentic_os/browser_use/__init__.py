@@ -2,23 +2,56 @@
 
 This module exposes the public API of :mod:`browser_use` under
 ``agentic_os.browser_use`` so existing code can migrate seamlessly.
+Names are resolved lazily on first access, so importing this module does
+not load the browser, LLM and DOM stacks until something is used.
 """
 
-import browser_use
-from browser_use import *  # noqa: F401,F403
-from browser_use.agent.planning import BrowserPlanner, Plan, PlannerContext
-from browser_use.agent.memory_adapter import (
-    BrowserMemory,
-    initialize_memory,
-    maybe_create_procedural_memory,
-)
-
-__all__ = [
-    *browser_use.__all__,  # type: ignore[name-defined]
-    "BrowserPlanner",
-    "Plan",
-    "PlannerContext",
-    "BrowserMemory",
-    "initialize_memory",
-    "maybe_create_procedural_memory",
-]
+import importlib
+from typing import Any
+
+# public name -> (module, attribute)
+_LAZY: dict[str, tuple[str, str]] = {
+	**{
+		name: ('browser_use', name)
+		for name in (
+			'Agent',
+			'Browser',
+			'BrowserConfig',
+			'BrowserSession',
+			'BrowserProfile',
+			'Controller',
+			'DomService',
+			'SystemPrompt',
+			'ActionResult',
+			'ActionModel',
+			'AgentHistoryList',
+			'BrowserContext',
+			'BrowserContextConfig',
+			'AGENTIC_OS_CONFIG',
+		)
+	},
+	'BatchingPlanner': ('browser_use.agent.planning', 'BatchingPlanner'),
+	'BrowserPlanner': ('browser_use.agent.planning', 'BrowserPlanner'),
+	'Plan': ('browser_use.agent.planning', 'Plan'),
+	'PlannerContext': ('browser_use.agent.planning', 'PlannerContext'),
+	'BrowserMemory': ('browser_use.agent.memory_adapter', 'BrowserMemory'),
+	'initialize_memory': ('browser_use.agent.memory_adapter', 'initialize_memory'),
+	'maybe_create_procedural_memory': ('browser_use.agent.memory_adapter', 'maybe_create_procedural_memory'),
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str) -> Any:
+	try:
+		module_name, attr = _LAZY[name]
+	except KeyError:
+		raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+	value = getattr(importlib.import_module(module_name), attr)
+	# cache on the module so later lookups bypass __getattr__
+	globals()[name] = value
+	return value
+
+
+def __dir__() -> list[str]:
+	return sorted({*globals(), *__all__})
@@ -3,13 +3,37 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel, ConfigDict, Field
+import collections
+import functools
+import operator
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 from browser_use.llm.messages import BaseMessage
 
 
+@functools.cache
+def _get_encoding(name: str) -> Any:
+	"""Load (and share) the tiktoken encoding ``name``; tiktoken is an optional dependency."""
+	try:
+		import tiktoken
+	except ImportError as e:
+		raise ImportError(f'ContextManager(encoding={name!r}) requires tiktoken: pip install tiktoken') from e
+	# may download the encoding files on first use, so this only runs when a manager is created
+	return tiktoken.get_encoding(name)
+
+
+# per-type text accessor, resolved the first time a message type is seen
+_TEXT_EXTRACTORS: dict[type, Callable[[Any], Any]] = {}
+
+
 class ContextSnapshot(BaseModel):
-	"""Serialized snapshot of a context window."""
+	"""Serialized snapshot of a context window.
+
+	Snapshots taken by :meth:`ContextManager.snapshot` may be shared between callers, so treat them as read-only.
+	"""
 
 	messages: list[BaseMessage] = Field(default_factory=list)
 	"""Messages currently stored in the context."""
@@ -22,46 +46,106 @@ class ContextSnapshot(BaseModel):
 
 	model_config = ConfigDict(arbitrary_types_allowed=True)
 
+	# per-message token counts captured by ContextManager.snapshot(), so restore() can skip re-tokenizing
+	_token_counts: list[int] | None = PrivateAttr(default=None)
+
 
 class ContextManager:
 	"""Manage a rolling context window for LLM tasks."""
 
-	def __init__(self, max_tokens: int = 4096) -> None:
+	def __init__(self, max_tokens: int = 4096, *, encoding: str | None = None) -> None:
+		"""``encoding`` names a tiktoken encoding (e.g. ``'cl100k_base'``) to count BPE tokens with.
+
+		It is loaded here, which needs tiktoken and may download the encoding; by default tokens
+		are approximated by whitespace-separated words.
+		"""
 		self.max_tokens = max_tokens
-		self._messages: list[BaseMessage] = []
+		self._encoding = _get_encoding(encoding) if encoding else None
+		# (message, token count) pairs so trimming never has to re-count a message
+		self._entries: collections.deque[tuple[BaseMessage, int]] = collections.deque()
 		self._current_tokens = 0
+		# snapshot of the current state, shared until the next change; None once stale
+		self._snapshot: ContextSnapshot | None = None
+
+	@staticmethod
+	def _message_text(message: BaseMessage) -> str:
+		extractor = _TEXT_EXTRACTORS.get(type(message))
+		if extractor is None:
+			extractor = operator.attrgetter('text') if hasattr(message, 'text') else str
+			_TEXT_EXTRACTORS[type(message)] = extractor
+		return str(extractor(message))
 
 	def _count_tokens(self, message: BaseMessage) -> int:
-		"""Very rough token estimate based on whitespace splitting."""
-		text = getattr(message, 'text', str(message))
-		return len(str(text).split())
+		"""Count BPE tokens with the configured encoding, or whitespace-separated words without one."""
+		text = self._message_text(message)
+		enc = self._encoding
+		if enc is None:
+			return len(text.split())
+		# same ids as encode(text, disallowed_special=()) but skips the special-token scan
+		return len(enc.encode_ordinary(text))
 
 	def add_message(self, message: BaseMessage) -> None:
 		"""Add ``message`` to the context, trimming old messages if needed."""
-		self._messages.append(message)
-		self._current_tokens += self._count_tokens(message)
+		tokens = self._count_tokens(message)
+		self._entries.append((message, tokens))
+		self._current_tokens += tokens
+		self._snapshot = None
+		self._trim_messages()
+
+	def _count_tokens_batch(self, messages: list[BaseMessage]) -> list[int]:
+		"""Count tokens for several messages with a single batched encode."""
+		texts = [self._message_text(message) for message in messages]
+		enc = self._encoding
+		if enc is None:
+			return [len(text.split()) for text in texts]
+		return [len(tokens) for tokens in enc.encode_ordinary_batch(texts)]
+
+	def add_messages(self, messages: Iterable[BaseMessage]) -> None:
+		"""Add several messages at once, counting their tokens in a single batch."""
+		messages = list(messages)
+		counts = self._count_tokens_batch(messages)
+		for message, tokens in zip(messages, counts):
+			self._entries.append((message, tokens))
+			self._current_tokens += tokens
+		self._snapshot = None
 		self._trim_messages()
 
 	def _trim_messages(self) -> None:
 		"""Ensure token count stays within ``max_tokens``."""
-		while self._messages and self._current_tokens > self.max_tokens:
-			removed = self._messages.pop(0)
-			self._current_tokens -= self._count_tokens(removed)
+		while self._entries and self._current_tokens > self.max_tokens:
+			_, tokens = self._entries.popleft()
+			self._current_tokens -= tokens
+			self._snapshot = None
 
 	def get_messages(self) -> list[BaseMessage]:
 		"""Return a copy of the current message list."""
-		return list(self._messages)
+		return [message for message, _ in self._entries]
 
 	def snapshot(self) -> ContextSnapshot:
 		"""Return a snapshot representing the current context."""
-		return ContextSnapshot(
+		# unchanged since the last snapshot (e.g. repeated checkpoints, or right after restore()): reuse it
+		if self._snapshot is not None:
+			return self._snapshot
+		# state is internal and already well-typed, so skip per-message validation
+		snapshot = ContextSnapshot.model_construct(
 			messages=self.get_messages(),
 			current_tokens=self._current_tokens,
 			max_tokens=self.max_tokens,
 		)
+		snapshot._token_counts = [tokens for _, tokens in self._entries]
+		self._snapshot = snapshot
+		return snapshot
 
 	def restore(self, snapshot: ContextSnapshot) -> None:
 		"""Restore context state from ``snapshot``."""
 		self.max_tokens = snapshot.max_tokens
-		self._messages = list(snapshot.messages)
-		self._current_tokens = snapshot.current_tokens
+		messages = snapshot.messages
+		counts = snapshot._token_counts
+		if counts is None or len(counts) != len(messages):
+			# snapshot was built elsewhere (e.g. deserialized), so count once in a batch
+			counts = self._count_tokens_batch(messages)
+		self._entries = collections.deque(zip(messages, counts))
+		# derive the total from the entries so trimming arithmetic stays exact
+		self._current_tokens = sum(counts)
+		# a snapshot taken by snapshot() describes exactly the restored state, so keep serving it
+		self._snapshot = snapshot if counts is snapshot._token_counts else None
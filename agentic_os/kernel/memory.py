@@ -3,22 +3,30 @@
 
 from __future__ import annotations
 
+import collections
+import functools
+import itertools
 from typing import Any, Callable, Dict
 
 from agentic_os.memory import MemoryStore
 
 
 class InMemoryStore:
-	"""Simple in-memory implementation of :class:`MemoryStore`."""
+	"""Simple in-memory implementation of :class:`MemoryStore`.
 
-	def __init__(self) -> None:
-		self._items: list[Any] = []
+	At most ``maxlen`` items are kept; the oldest are evicted first.
+	"""
+
+	def __init__(self, maxlen: int | None = 10_000) -> None:
+		self._items: collections.deque[Any] = collections.deque(maxlen=maxlen)
 
 	async def store(self, text: str) -> None:
 		self._items.append(text)
 
 	async def retrieve(self, limit: int | None = None) -> list[Any]:
-		return self._items[-limit:] if limit else list(self._items)
+		if not limit:
+			return list(self._items)
+		return list(itertools.islice(self._items, max(0, len(self._items) - limit), None))
 
 	async def snapshot(self) -> list[Any]:
 		return list(self._items)
@@ -27,8 +35,9 @@ class InMemoryStore:
 class MemoryManager:
 	"""Manage short term memory for multiple agents."""
 
-	def __init__(self, store_factory: Callable[[], MemoryStore] | None = None) -> None:
-		self._store_factory = store_factory or InMemoryStore
+	def __init__(self, store_factory: Callable[[], MemoryStore] | None = None, maxlen: int | None = 10_000) -> None:
+		"""``maxlen`` caps each agent's default :class:`InMemoryStore`; it is ignored when ``store_factory`` is given."""
+		self._store_factory = store_factory or functools.partial(InMemoryStore, maxlen=maxlen)
 		self._stores: Dict[str, MemoryStore] = {}
 
 	def _get_store(self, agent_id: str) -> MemoryStore:
@@ -3,61 +3,76 @@
 
 from __future__ import annotations
 
+import collections
 import heapq
 from collections.abc import AsyncGenerator
 from typing import Any
 
 
 class AgentScheduler:
-	"""Simple cooperative scheduler for agent async generators."""
+	"""Simple cooperative scheduler for agent async generators.
+
+	``fifo`` and ``round_robin`` run agents in registration order from a deque;
+	``priority`` runs the highest-priority agent until it is exhausted.
+	"""
 
 	def __init__(self, strategy: str = 'fifo') -> None:
-		if strategy not in {'fifo', 'round_robin'}:
-			raise ValueError('strategy must be "fifo" or "round_robin"')
+		if strategy not in {'fifo', 'round_robin', 'priority'}:
+			raise ValueError('strategy must be "fifo", "round_robin" or "priority"')
 		self.strategy = strategy
 		self._agents: dict[str, AsyncGenerator[Any, None]] = {}
-		self._queue: list[tuple[int, int, str]] = []
+		self._queue: collections.deque[str] = collections.deque()
+		self._heap: list[tuple[int, int, str]] = []
 		self._counter = 0
 
 	def register_agent(self, agent_id: str, generator: AsyncGenerator[Any, None], priority: int = 0) -> None:
-		"""Register an async generator representing an agent."""
+		"""Register an async generator representing an agent.
+
+		``priority`` is only used by the ``priority`` strategy.
+		"""
 		if agent_id in self._agents:
 			raise ValueError(f'agent {agent_id} already registered')
 		self._agents[agent_id] = generator
-		heapq.heappush(self._queue, (-priority, self._counter, agent_id))
-		self._counter += 1
+		if self.strategy == 'priority':
+			heapq.heappush(self._heap, (-priority, self._counter, agent_id))
+			self._counter += 1
+		else:
+			self._queue.append(agent_id)
 
 	@property
 	def has_agents(self) -> bool:
-		return bool(self._queue)
+		return bool(self._agents)
 
 	async def step(self) -> tuple[str, Any] | None:
 		"""Run a single scheduling step and return the yielded result."""
-		if not self._queue:
-			return None
+		while self._agents:
+			if self.strategy == 'round_robin':
+				agent_id = self._queue.popleft()
+			elif self.strategy == 'fifo':
+				agent_id = self._queue[0]
+			else:
+				agent_id = self._heap[0][2]
+
+			gen = self._agents[agent_id]
+			try:
+				result = await anext(gen)
+			except StopAsyncIteration:
+				if self.strategy == 'fifo':
+					self._queue.popleft()
+				elif self.strategy == 'priority':
+					heapq.heappop(self._heap)
+				del self._agents[agent_id]
+				continue
 
-		if self.strategy == 'fifo':
-			priority, count, agent_id = self._queue[0]
-		else:
-			priority, count, agent_id = heapq.heappop(self._queue)
-
-		gen = self._agents[agent_id]
-		try:
-			result = await anext(gen)
-		except StopAsyncIteration:
-			if self.strategy == 'fifo':
-				heapq.heappop(self._queue)
-			del self._agents[agent_id]
-			return await self.step() if self._queue else None
-		else:
 			if self.strategy == 'round_robin':
-				heapq.heappush(self._queue, (priority, self._counter, agent_id))
-				self._counter += 1
+				self._queue.append(agent_id)
 			return agent_id, result
 
+		return None
+
 	async def run(self) -> AsyncGenerator[tuple[str, Any], None]:
 		"""Yield results from agents according to the selected strategy."""
-		while self._queue:
+		while self._agents:
 			step = await self.step()
 			if step is not None:
 				yield step
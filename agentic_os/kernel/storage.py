@@ -3,10 +3,25 @@
 
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
 
 import aiofiles
 
+# Payloads at or above this size are streamed through aiofiles; smaller ones are
+# written with a single asyncio.to_thread hop instead of aiofiles' open/write/close hops.
+_LARGE_FILE_BYTES = 1024 * 1024
+
+
+def _utf8_size_below(text: str, limit: int) -> bool:
+	"""Whether ``text`` encodes to fewer than ``limit`` UTF-8 bytes; only encodes when the length can't tell."""
+	# a character takes 1-4 bytes, so most texts are decided by their length alone
+	if len(text) * 4 < limit:
+		return True
+	if len(text) >= limit:
+		return False
+	return len(text.encode('utf-8')) < limit
+
 
 class StorageManager:
 	"""Persist agent data to disk with basic security checks."""
@@ -14,31 +29,39 @@ class StorageManager:
 	def __init__(self, base_dir: str | Path) -> None:
 		self.base_dir = Path(base_dir)
 		self.base_dir.mkdir(parents=True, exist_ok=True)
+		self._resolved_base = self.base_dir.resolve()
+		self._agent_dirs: set[str] = set()
 
 	def _resolve_path(self, agent_id: str, filename: str) -> Path:
-		agent_dir = self.base_dir / agent_id
-		agent_dir.mkdir(parents=True, exist_ok=True)
+		agent_dir = self._resolved_base / agent_id
 		path = (agent_dir / filename).resolve()
-		if not str(path).startswith(str(self.base_dir.resolve())):
+		if not path.is_relative_to(self._resolved_base):
 			raise ValueError('invalid file path outside storage directory')
+		if agent_id not in self._agent_dirs:
+			agent_dir.mkdir(parents=True, exist_ok=True)
+			self._agent_dirs.add(agent_id)
 		return path
 
 	async def write_text(self, agent_id: str, filename: str, text: str) -> None:
 		path = self._resolve_path(agent_id, filename)
-		async with aiofiles.open(path, 'w') as f:
+		if _utf8_size_below(text, _LARGE_FILE_BYTES):
+			await asyncio.to_thread(path.write_text, text, encoding='utf-8')
+			return
+		async with aiofiles.open(path, 'w', encoding='utf-8') as f:
 			await f.write(text)
 
 	async def read_text(self, agent_id: str, filename: str) -> str:
 		path = self._resolve_path(agent_id, filename)
-		async with aiofiles.open(path, 'r') as f:
-			return await f.read()
+		return await asyncio.to_thread(path.read_text, encoding='utf-8')
 
 	async def write_bytes(self, agent_id: str, filename: str, data: bytes) -> None:
 		path = self._resolve_path(agent_id, filename)
+		if len(data) < _LARGE_FILE_BYTES:
+			await asyncio.to_thread(path.write_bytes, data)
+			return
 		async with aiofiles.open(path, 'wb') as f:
 			await f.write(data)
 
 	async def read_bytes(self, agent_id: str, filename: str) -> bytes:
 		path = self._resolve_path(agent_id, filename)
-		async with aiofiles.open(path, 'rb') as f:
-			return await f.read()
+		return await asyncio.to_thread(path.read_bytes)
@@ -3,48 +3,55 @@
 
 from __future__ import annotations
 
+from functools import partial
+from inspect import isawaitable
 from typing import Any
 
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel
 
 from agentic_os import get_registry
-from agentic_os.tools import ToolSpec
+from agentic_os.tools import ToolSpec, validate_input
 from browser_use.llm.base import BaseChatModel
+from browser_use.utils import CallCoalescer
 
 
 class LLMSyscallInterface:
-	"""Simple syscall interface for interacting with LLMs and tools."""
+	"""Simple syscall interface for interacting with LLMs and tools.
 
-	def __init__(self, llm: BaseChatModel, registry: dict[str, ToolSpec] | None = None) -> None:
+	With ``batch_window_ms`` > 0, :meth:`invoke_llm` calls that arrive within the window of the
+	first pending one are started together. Each call is still its own request; this only groups
+	submission timing and adds up to the window in latency.
+	"""
+
+	def __init__(self, llm: BaseChatModel, registry: dict[str, ToolSpec] | None = None, *, batch_window_ms: float = 0) -> None:
 		self._llm = llm
 		self._registry = registry or get_registry()
+		self._batch_window_ms = batch_window_ms
+		self._coalescer = CallCoalescer(batch_window_ms)
 
 	async def invoke_llm(self, messages: list[Any], output_model: type[BaseModel] | None = None) -> Any:
 		"""Invoke the underlying LLM with the given messages."""
 		assert isinstance(messages, list), 'messages must be a list'
-		return await self._llm.ainvoke(messages, output_model)
+		if self._batch_window_ms <= 0:
+			return await self._llm.ainvoke(messages, output_model)
+		return await self._coalescer.submit(partial(self._llm.ainvoke, messages, output_model))
 
 	async def invoke_tool(self, tool_id: str, params: dict[str, Any] | BaseModel | None = None) -> Any:
 		"""Invoke a registered tool with validated parameters."""
-		if tool_id not in self._registry:
-		    raise ValueError(f'unknown tool {tool_id}')
+		spec = self._registry.get(tool_id)
+		if spec is None:
+			raise ValueError(f'unknown tool {tool_id}')
 
-		spec = self._registry[tool_id]
 		if spec.func is None:
-		    raise ValueError(f'tool {tool_id} is missing callable')
+			raise ValueError(f'tool {tool_id} is missing callable')
 
 		if spec.input_model is not None:
-		    try:
-		        if isinstance(params, BaseModel):
-		            parsed = params
-		        else:
-		            parsed = spec.input_model.model_validate(params or {})
-		    except ValidationError as exc:
-		        raise exc
+			# invalid params raise pydantic's ValidationError
+			parsed = params if isinstance(params, BaseModel) else validate_input(spec, params or {})
 		else:
-		    parsed = params
+			parsed = params
 
 		result = spec.func(parsed) if parsed is not None else spec.func()
-		if hasattr(result, '__await__'):
-		    return await result
+		if isawaitable(result):
+			return await result
 		return result
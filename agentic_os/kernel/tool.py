@@ -3,11 +3,12 @@
 
 from __future__ import annotations
 
+from inspect import isawaitable
 from typing import Any, Iterable, Dict
 
 from pydantic import BaseModel
 
-from agentic_os.tools import ToolSpec
+from agentic_os.tools import ToolSpec, validate_input
 
 
 class ToolManager:
@@ -15,40 +16,76 @@ class ToolManager:
 
 	def __init__(self, specs: Iterable[ToolSpec] | None = None) -> None:
 		self._registry: Dict[str, ToolSpec] = {}
+		# index-aligned dispatch table built by _freeze(); None when a register() made it stale
+		self._index: Dict[str, int] | None = None
+		self._specs: tuple[ToolSpec, ...] = ()
 		if specs:
-			for spec in specs:
-				self.register(spec)
+			self.register_many(specs)
 
 	def register(self, spec: ToolSpec) -> None:
 		"""Register a :class:`ToolSpec`, checking for conflicts."""
-		if spec.id in self._registry:
-			existing = self._registry[spec.id]
-			if existing != spec:
-				raise ValueError(f'conflicting spec for {spec.id}')
-			return
-		self._registry[spec.id] = spec
+		self.register_many((spec,))
+
+	def register_many(self, specs: Iterable[ToolSpec]) -> None:
+		"""Register several specs at once; if any of them conflicts, none are registered."""
+		incoming: Dict[str, ToolSpec] = {}
+		conflicts: set[str] = set()
+		for spec in specs:
+			first = incoming.setdefault(spec.id, spec)
+			if first is not spec and first != spec:
+				conflicts.add(spec.id)
+		# only ids already registered need the field-by-field compare
+		for tool_id in self._registry.keys() & incoming.keys():
+			existing = self._registry[tool_id]
+			spec = incoming.pop(tool_id)
+			# re-registering the same object is the common case; skip the compare
+			if existing is not spec and existing != spec:
+				conflicts.add(tool_id)
+		if conflicts:
+			raise ValueError(f'conflicting spec for {", ".join(sorted(conflicts))}')
+		if incoming:
+			self._registry.update(incoming)
+			self._index = None
 
 	def load_from(self, registry: Dict[str, ToolSpec]) -> None:
 		"""Load multiple specs from an existing registry."""
-		for spec in registry.values():
-			self.register(spec)
+		self.register_many(registry.values())
 
 	def get(self, tool_id: str) -> ToolSpec:
 		"""Return the spec for ``tool_id``."""
 		return self._registry[tool_id]
 
+	def _freeze(self) -> Dict[str, int]:
+		"""Snapshot the registry into a tuple so dispatch by position skips the dict lookup."""
+		self._specs = tuple(self._registry.values())
+		self._index = {spec.id: i for i, spec in enumerate(self._specs)}
+		return self._index
+
+	def index(self, tool_id: str) -> int:
+		"""Return the dispatch index of ``tool_id`` for :meth:`execute_by_index`."""
+		index = self._index
+		if index is None:
+			index = self._freeze()
+		return index[tool_id]
+
 	async def execute(self, tool_id: str, params: dict[str, Any] | BaseModel | None = None) -> Any:
 		"""Validate ``params`` using the tool's model and run it."""
-		spec = self.get(tool_id)
+		return await self.execute_by_index(self.index(tool_id), params)
+
+	async def execute_by_index(self, index: int, params: dict[str, Any] | BaseModel | None = None) -> Any:
+		"""Like :meth:`execute` but addressed by an index from :meth:`index`, for callers dispatching the same tool repeatedly."""
+		if self._index is None:
+			self._freeze()
+		spec = self._specs[index]
 		if spec.func is None:
-			raise ValueError(f'tool {tool_id} has no callable')
+			raise ValueError(f'tool {spec.id} has no callable')
 
 		if spec.input_model is not None:
-			parsed = params if isinstance(params, BaseModel) else spec.input_model.model_validate(params or {})
+			parsed = params if isinstance(params, BaseModel) else validate_input(spec, params or {})
 		else:
 			parsed = params
 
 		result = spec.func(parsed) if parsed is not None else spec.func()
-		if hasattr(result, '__await__'):
+		if isawaitable(result):
 			return await result
 		return result
@@ -1,25 +1,73 @@
-from dataclasses import dataclass
-from typing import Any, Callable, Dict, Type
+import sys
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple, Type
 
 from pydantic import BaseModel
 
 
-@dataclass
+# slots: specs are long-lived and read on every dispatch. Not frozen, because
+# register_spec() interns the strings in place and validate_input() fills _validate.
+@dataclass(slots=True)
 class ToolSpec:
     id: str
     description: str
     input_model: Type[BaseModel]
     output_model: Type[BaseModel]
     func: Callable[..., Any] | None = None
+    # input_model's core validator, resolved on first use by validate_input()
+    _validate: Callable[[Any], BaseModel] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+
+def validate_input(spec: ToolSpec, params: Any) -> BaseModel:
+    """Validate ``params`` against ``spec.input_model`` with a direct core-validator call."""
+    validate = spec._validate
+    if validate is None:
+        validate = spec._validate = spec.input_model.__pydantic_validator__.validate_python
+    return validate(params)
 
 
 _registry: Dict[str, ToolSpec] = {}
+# callables that register their specs on first registry access, with the ids
+# they provide when declared (None: unknown, only run by a full registry read)
+_pending_loaders: List[Tuple[Callable[[], None], Optional[FrozenSet[str]]]] = []
 
 
 def register_spec(spec: ToolSpec) -> None:
     """Register a tool specification."""
+    # ids and descriptions are long-lived and end up in every prompt, so share one copy of each
+    spec.id = sys.intern(spec.id)
+    spec.description = sys.intern(spec.description)
     _registry[spec.id] = spec
 
 
+def register_lazy(loader: Callable[[], None], ids: Iterable[str] | None = None) -> None:
+    """Defer ``loader`` (which calls :func:`register_spec`) until the registry is first read.
+
+    ``ids`` lists the tools the loader registers, so :func:`get_spec` can run just
+    that loader instead of every pending one.
+    """
+    _pending_loaders.append((loader, frozenset(ids) if ids is not None else None))
+
+
 def get_registry() -> Dict[str, ToolSpec]:
+    while _pending_loaders:
+        loader, _ = _pending_loaders.pop(0)
+        loader()
     return _registry
+
+
+def get_spec(tool_id: str) -> ToolSpec | None:
+    """Look up one spec by id; ``None`` if it is not registered."""
+    spec = _registry.get(tool_id)
+    if spec is not None or not _pending_loaders:
+        return spec
+    for entry in [e for e in _pending_loaders if e[1] is not None and tool_id in e[1]]:
+        _pending_loaders.remove(entry)
+        entry[0]()
+    spec = _registry.get(tool_id)
+    if spec is None:
+        get_registry()
+        spec = _registry.get(tool_id)
+    return spec
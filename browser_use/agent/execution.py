@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import operator
 from pathlib import Path
 from typing import Any
 
@@ -18,8 +19,8 @@ from browser_use.agent.views import (
     ActionResult,
     AgentHistory,
     AgentHistoryList,
-    BrowserStateSummary,
 )
+from browser_use.browser.views import BrowserStateSummary
 from browser_use.dom.history_tree_processor.service import (
     DOMHistoryElement,
     HistoryTreeProcessor,
@@ -28,6 +29,8 @@ from browser_use.utils import time_execution_async
 
 logger = logging.getLogger(__name__)
 
+_branch_path_hash = operator.attrgetter('hash.branch_path_hash')
+
 
 @time_execution_async('--multi_act')
 async def multi_act(self, actions: list[ActionModel], check_for_new_elements: bool = True) -> list[ActionResult]:
@@ -36,25 +39,27 @@ async def multi_act(self, actions: list[ActionModel], check_for_new_elements: bo
 
     assert self.browser_session is not None, 'BrowserSession is not set up'
     cached_selector_map = await self.browser_session.get_selector_map()
-    cached_path_hashes = {e.hash.branch_path_hash for e in cached_selector_map.values()}
+    cached_hash_by_idx = {idx: _branch_path_hash(e) for idx, e in cached_selector_map.items()}
+    cached_path_hashes = frozenset(cached_hash_by_idx.values())
 
     await self.browser_session.remove_highlights()
 
     for i, action in enumerate(actions):
-        if i > 0 and action.model_dump(exclude_unset=True).get('done') is not None:
+        # model_fields_set is tracked by pydantic already, so no serialization is needed here
+        set_fields = action.model_fields_set
+        if i > 0 and 'done' in set_fields and getattr(action, 'done', None) is not None:
             msg = f'Done action is allowed only as a single action - stopped after action {i} / {len(actions)}.'
             logger.info(msg)
             break
 
-        if action.get_index() is not None and i != 0:
+        idx = action.get_index()
+        if idx is not None and i != 0:
             new_browser_state_summary = await self.browser_session.get_state_summary(cache_clickable_elements_hashes=False)
-            new_selector_map = new_browser_state_summary.selector_map
+            new_hash_by_idx = {
+                new_idx: _branch_path_hash(e) for new_idx, e in new_browser_state_summary.selector_map.items()
+            }
 
-            orig_target = cached_selector_map.get(action.get_index())  # type: ignore
-            orig_target_hash = orig_target.hash.branch_path_hash if orig_target else None
-            new_target = new_selector_map.get(action.get_index())  # type: ignore
-            new_target_hash = new_target.hash.branch_path_hash if new_target else None
-            if orig_target_hash != new_target_hash:
+            if cached_hash_by_idx.get(idx) != new_hash_by_idx.get(idx):
                 msg = f'Element index changed after action {i} / {len(actions)}, because page changed.'
                 logger.info(msg)
                 results.append(
@@ -66,8 +71,8 @@ async def multi_act(self, actions: list[ActionModel], check_for_new_elements: bo
                 )
                 break
 
-            new_path_hashes = {e.hash.branch_path_hash for e in new_selector_map.values()}
-            if check_for_new_elements and not new_path_hashes.issubset(cached_path_hashes):
+            new_path_hashes = frozenset(new_hash_by_idx.values())
+            if check_for_new_elements and new_path_hashes - cached_path_hashes:
                 msg = f'Something new appeared after action {i} / {len(actions)}, following actions are NOT executed and should be retried.'
                 logger.info(msg)
                 results.append(
@@ -94,10 +99,11 @@ async def multi_act(self, actions: list[ActionModel], check_for_new_elements: bo
 
             results.append(result)
 
-            action_data = action.model_dump(exclude_unset=True)
-            action_name = next(iter(action_data.keys())) if action_data else 'unknown'
-            action_params = getattr(action, action_name, '')
-            self.logger.info(f'☑️ Executed action {i + 1}/{len(actions)}: {action_name}({action_params})')
+            agent_logger = self.logger
+            if agent_logger.isEnabledFor(logging.INFO):
+                action_name = next((name for name in type(action).model_fields if name in set_fields), 'unknown')
+                action_params = getattr(action, action_name, '')
+                agent_logger.info('☑️ Executed action %d/%d: %s(%s)', i + 1, len(actions), action_name, action_params)
             if results[-1].is_done or results[-1].error or i == len(actions) - 1:
                 break
 
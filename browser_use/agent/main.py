@@ -12,7 +12,6 @@ import inspect
 import json
 import logging
 import os
-import re
 import sys
 import tempfile
 import time
@@ -49,7 +48,16 @@ from browser_use.agent.message_manager.service import (
 from browser_use.agent.message_manager.utils import (
 	save_conversation,
 )
-from browser_use.agent.prompts import PlannerPrompt, SystemPrompt
+from browser_use.agent.planning import (
+	BatchingPlanner,
+	_build_planner_system_message,
+	_drop_images,
+	_invoke_planner,
+	_needs_think_strip,
+	_parse_plan_output,
+	_remove_think_tags,
+)
+from browser_use.agent.prompts import SystemPrompt
 from browser_use.agent.views import (
 	ActionResult,
 	AgentError,
@@ -73,7 +81,6 @@ from browser_use.dom.history_tree_processor.service import (
 	DOMHistoryElement,
 	HistoryTreeProcessor,
 )
-from browser_use.exceptions import LLMException
 from browser_use.filesystem.file_system import FileSystem
 from browser_use.sync import CloudSync
 from browser_use.telemetry.service import ProductTelemetry
@@ -179,6 +186,7 @@ class Agent(Generic[Context]):
 		page_extraction_llm: BaseChatModel | None = None,
 		planner_llm: BaseChatModel | None = None,
 		planner_interval: int = 1,  # Run planner every N steps
+		planner_batch_window_ms: float = 0,
 		is_planner_reasoning: bool = False,
 		extend_planner_system_message: str | None = None,
 		injected_agent_state: AgentState | None = None,
@@ -227,6 +235,7 @@ class Agent(Generic[Context]):
 			page_extraction_llm=page_extraction_llm,
 			planner_llm=planner_llm,
 			planner_interval=planner_interval,
+			planner_batch_window_ms=planner_batch_window_ms,
 			is_planner_reasoning=is_planner_reasoning,
 			extend_planner_system_message=extend_planner_system_message,
 			use_thinking=use_thinking,
@@ -240,6 +249,13 @@ class Agent(Generic[Context]):
 		if self.settings.planner_llm:
 			self.token_cost_service.register_llm(self.settings.planner_llm)
 
+		# Resolved once; the planner model does not change during a run
+		self._planner_needs_think_strip = bool(self.settings.planner_llm) and _needs_think_strip(self.settings.planner_llm)
+
+		# Planner system message, reused until the available actions change
+		self._planner_actions_key: tuple[str, str | None] | None = None
+		self._planner_system_message: BaseMessage | None = None
+
 		# Memory settings
 		self.enable_memory = enable_memory
 		self.memory_config = memory_config
@@ -314,8 +330,8 @@ class Agent(Generic[Context]):
 			sensitive_data=sensitive_data,
 		)
 
-                # Initialize memory using adapter
-                initialize_memory(self)
+		# Initialize memory using adapter
+		initialize_memory(self)
 
 		if isinstance(browser, BrowserSession):
 			browser_session = browser_session or browser
@@ -607,26 +623,8 @@ class Agent(Generic[Context]):
 		self.DoneActionModel = self.controller.registry.create_action_model(include_actions=['done'])
 		if self.settings.use_thinking:
 			self.DoneAgentOutput = AgentOutput.type_with_custom_actions(self.DoneActionModel)
-                else:
-                        self.DoneAgentOutput = AgentOutput.type_with_custom_actions_no_thinking(self.DoneActionModel)
-
-
-# Bind external implementations from helper modules
-from browser_use.agent.execution import (
-    multi_act as _exec_multi_act,
-    rerun_history as _exec_rerun_history,
-    _execute_history_step as _exec_execute_history_step,
-    _update_action_indices as _exec_update_action_indices,
-    load_and_rerun as _exec_load_and_rerun,
-    _update_action_models_for_page as _exec_update_action_models_for_page,
-)
-
-Agent.multi_act = _exec_multi_act
-Agent.rerun_history = _exec_rerun_history
-Agent._execute_history_step = _exec_execute_history_step
-Agent._update_action_indices = _exec_update_action_indices
-Agent.load_and_rerun = _exec_load_and_rerun
-Agent._update_action_models_for_page = _exec_update_action_models_for_page
+		else:
+			self.DoneAgentOutput = AgentOutput.type_with_custom_actions_no_thinking(self.DoneActionModel)
 
 	def add_new_task(self, new_task: str) -> None:
 		"""Add a new task to the agent, keeping the same task_id as tasks are continuous"""
@@ -662,8 +660,8 @@ Agent._update_action_models_for_page = _exec_update_action_models_for_page
 
 			self._log_step_context(current_page, browser_state_summary)
 
-                        # generate procedural memory if needed
-                        maybe_create_procedural_memory(self)
+			# generate procedural memory if needed
+			maybe_create_procedural_memory(self)
 
 			await self._raise_if_stopped_or_paused()
 
@@ -690,7 +688,7 @@ Agent._update_action_models_for_page = _exec_update_action_models_for_page
 
 			# Run planner at specified intervals if planner is configured
 			if self.settings.planner_llm and self.state.n_steps % self.settings.planner_interval == 0:
-				plan = await self._run_planner()
+				plan = await self._plan_or_none(self._get_planner_messages(page_filtered_actions))
 				# add plan before last state message
 				self._message_manager.add_plan(plan, position=-1)
 
@@ -936,16 +934,8 @@ Agent._update_action_models_for_page = _exec_update_action_models_for_page
 
 		self.state.history.history.append(history_item)
 
-	THINK_TAGS = re.compile(r'<think>.*?</think>', re.DOTALL)
-	STRAY_CLOSE_TAG = re.compile(r'.*?</think>', re.DOTALL)
-
 	def _remove_think_tags(self, text: str) -> str:
-		# Step 1: Remove well-formed <think>...</think>
-		text = re.sub(self.THINK_TAGS, '', text)
-		# Step 2: If there's an unmatched closing tag </think>,
-		#         remove everything up to and including that.
-		text = re.sub(self.STRAY_CLOSE_TAG, '', text)
-		return text.strip()
+		return _remove_think_tags(text)
 
 	@time_execution_async('--get_next_action')
 	async def get_next_action(self, input_messages: list[BaseMessage]) -> AgentOutput:
@@ -1593,73 +1583,62 @@ Agent._update_action_models_for_page = _exec_update_action_models_for_page
 			setattr(self.llm, '_verified_api_keys', True)
 			return True
 
-	async def _run_planner(self) -> str | None:
-		"""Run the planner to analyze state and suggest next steps"""
-		# Skip planning if no planner_llm is set
-		if not self.settings.planner_llm:
-			return None
-
-		# Get current state to filter actions by page
-		assert self.browser_session is not None, 'BrowserSession is not set up'
-		page = await self.browser_session.get_current_page()
-
-		# Get all standard actions (no filter) and page-specific actions
+	def _get_planner_messages(self, page_actions: str | None) -> list[BaseMessage]:
+		"""Build the planner input from the current message history and available actions"""
+		# Get all standard actions (no filter); page-specific actions were already computed for this step
 		standard_actions = self.controller.registry.get_prompt_description()  # No page = system prompt actions
-		page_actions = self.controller.registry.get_prompt_description(page)  # Page-specific actions
 
-		# Combine both for the planner
-		all_actions = standard_actions
-		if page_actions:
-			all_actions += '\n' + page_actions
+		# The registry returns the same cached strings while its actions are unchanged, so this
+		# comparison is usually an identity check and the combined prompt is only rebuilt on change
+		actions_key = (standard_actions, page_actions)
+		if self._planner_system_message is None or self._planner_actions_key != actions_key:
+			# Combine both for the planner
+			all_actions = standard_actions
+			if page_actions:
+				all_actions += '\n' + page_actions
+			self._planner_system_message = _build_planner_system_message(
+				all_actions,
+				self.settings.is_planner_reasoning,
+				self.settings.extend_planner_system_message,
+			)
+			self._planner_actions_key = actions_key
 
 		# Create planner message history using full message history with all available actions
 		planner_messages = [
-			PlannerPrompt(all_actions).get_system_message(
-				is_planner_reasoning=self.settings.is_planner_reasoning,
-				extended_planner_system_prompt=self.settings.extend_planner_system_message,
-			),
-			*self._message_manager.get_messages()[1:],  # Use full message history except the first
+			self._planner_system_message,
+			*self._message_manager.get_messages_view(skip=1),  # Use full message history except the first
 		]
 
 		if not self.settings.use_vision_for_planner and self.settings.use_vision:
-			last_state_message: UserMessage = planner_messages[-1]
 			# remove image from last state message
-			new_msg = ''
-			if isinstance(last_state_message.content, list):
-				for msg in last_state_message.content:
-					if msg.type == 'text':
-						new_msg += msg.text
-					elif msg.type == 'image_url':
-						continue
-			else:
-				new_msg = last_state_message.content
+			planner_messages[-1] = _drop_images(planner_messages[-1])
 
-			planner_messages[-1] = UserMessage(content=new_msg)
+		return planner_messages
 
-		# Get planner output
-		try:
-			response = await self.settings.planner_llm.ainvoke(planner_messages)
-		except Exception as e:
-			self.logger.error(f'Failed to invoke planner: {str(e)}')
-			# Extract status code if available (e.g., from HTTP exceptions)
-			status_code = getattr(e, 'status_code', None) or getattr(e, 'code', None) or 500
-			error_msg = f'Planner LLM API call failed: {type(e).__name__}: {str(e)}'
-			raise LLMException(status_code, error_msg) from e
-
-		plan = response.completion
-		# if deepseek-reasoner, remove think tags
-		if self.settings.planner_llm and (
-			'deepseek-r1' in self.settings.planner_llm.model or 'deepseek-reasoner' in self.settings.planner_llm.model
-		):
-			plan = self._remove_think_tags(plan)
+	async def _plan_or_none(self, planner_messages: list[BaseMessage]) -> str | None:
+		"""Run the planner; the plan is advisory, so a planner failure never fails the step"""
 		try:
-			plan_json = json.loads(plan)
-			self.logger.info(f'Planning Analysis:\n{json.dumps(plan_json, indent=4)}')
-		except json.JSONDecodeError:
-			self.logger.info(f'Planning Analysis:\n{plan}')
+			return await self._run_planner(planner_messages)
 		except Exception as e:
-			self.logger.debug(f'Error parsing planning analysis: {e}')
-			self.logger.info(f'Plan: {plan}')
+			self.logger.warning(f'⚠️ Planner failed, continuing without a plan: {type(e).__name__}: {e}')
+			return None
+
+	async def _run_planner(self, planner_messages: list[BaseMessage]) -> str | None:
+		"""Run the planner to analyze state and suggest next steps"""
+		# Skip planning if no planner_llm is set
+		if not self.settings.planner_llm:
+			return None
+
+		if self.settings.planner_batch_window_ms > 0:
+			batcher = BatchingPlanner.for_llm(self.settings.planner_llm, self.settings.planner_batch_window_ms)
+			plan = await batcher.invoke(planner_messages)
+		else:
+			plan = await _invoke_planner(
+				self.settings.planner_llm, planner_messages, self.logger, strip_think=self._planner_needs_think_strip
+			)
+		# the plan is only parsed to pretty-print it, so skip the work when INFO logs are dropped
+		if self.logger.isEnabledFor(logging.INFO):
+			_parse_plan_output(plan, self.logger)
 
 		return plan
 
@@ -1696,3 +1675,21 @@ Agent._update_action_models_for_page = _exec_update_action_models_for_page
 			self.DoneAgentOutput = AgentOutput.type_with_custom_actions(self.DoneActionModel)
 		else:
 			self.DoneAgentOutput = AgentOutput.type_with_custom_actions_no_thinking(self.DoneActionModel)
+
+
+# Bind external implementations from helper modules
+from browser_use.agent.execution import (
+	multi_act as _exec_multi_act,
+	rerun_history as _exec_rerun_history,
+	_execute_history_step as _exec_execute_history_step,
+	_update_action_indices as _exec_update_action_indices,
+	load_and_rerun as _exec_load_and_rerun,
+	_update_action_models_for_page as _exec_update_action_models_for_page,
+)
+
+Agent.multi_act = _exec_multi_act
+Agent.rerun_history = _exec_rerun_history
+Agent._execute_history_step = _exec_execute_history_step
+Agent._update_action_indices = _exec_update_action_indices
+Agent.load_and_rerun = _exec_load_and_rerun
+Agent._update_action_models_for_page = _exec_update_action_models_for_page
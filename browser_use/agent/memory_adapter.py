@@ -3,8 +3,12 @@
 
 from __future__ import annotations
 
+import collections
+import itertools
 import logging
+import sys
 import time
+from collections.abc import Iterable
 
 from pydantic import BaseModel, Field
 
@@ -21,28 +25,65 @@ class MemoryEntry(BaseModel):
 
 
 class BrowserMemory:
-    """Simple in-memory storage for text snippets."""
+    """Simple in-memory storage for text snippets.
 
-    def __init__(self) -> None:
-        self._entries: list[MemoryEntry] = []
+    Entries are stored column-wise (texts and timestamps in parallel arrays) and only
+    materialized as :class:`MemoryEntry` objects when they are read back. At most
+    ``maxlen`` entries are kept; the oldest are evicted first.
+    """
+
+    def __init__(self, maxlen: int | None = 10_000) -> None:
+        # parallel ring buffers: once maxlen is reached the oldest entry is evicted on append
+        self._texts: collections.deque[str] = collections.deque(maxlen=maxlen)
+        self._timestamps: collections.deque[float] = collections.deque(maxlen=maxlen)
         self.logger = logger.getChild('BrowserMemory')
 
+    @staticmethod
+    def _tail(column: collections.deque, n: int) -> list:
+        """Last ``n`` items of ``column`` in order, walking only those from the right end."""
+        items = list(itertools.islice(reversed(column), n))
+        items.reverse()
+        return items
+
+    def _materialize(self, limit: int | None = None) -> list[MemoryEntry]:
+        if not limit or limit >= len(self._texts):
+            texts, timestamps = self._texts, self._timestamps
+        else:
+            texts, timestamps = self._tail(self._texts, limit), self._tail(self._timestamps, limit)
+        # the data was produced internally, so skip pydantic validation
+        return [
+            MemoryEntry.model_construct(text=text, timestamp=timestamp)
+            for text, timestamp in zip(texts, timestamps)
+        ]
+
     async def store(self, text: str) -> None:
         """Store a new memory entry."""
-        self._entries.append(MemoryEntry(text=text))
+        self._texts.append(text)
+        self._timestamps.append(time.time())
+
+    async def store_many(self, texts: Iterable[str]) -> None:
+        """Store several entries at once, in order, sharing one timestamp."""
+        texts = list(texts)
+        self._texts.extend(texts)
+        self._timestamps.extend(itertools.repeat(time.time(), len(texts)))
 
     async def retrieve(self, limit: int | None = None) -> list[MemoryEntry]:
         """Retrieve the most recent memory entries."""
-        if limit is None:
-            return list(self._entries)
-        return self._entries[-limit:]
+        return self._materialize(limit)
 
     async def snapshot(self) -> list[MemoryEntry]:
         """Return a copy of all stored memories."""
-        return list(self._entries)
+        return self._materialize()
+
+
+def _next_memory_step(n_steps: int, interval: int) -> int:
+    """Return the first multiple of ``interval`` that is ``>= n_steps``."""
+    return -(-n_steps // interval) * interval
 
 
 def initialize_memory(agent) -> None:
+    # step at which the next procedural memory is due; sys.maxsize keeps the per-step check a single compare
+    agent._next_memory_step = sys.maxsize
     if agent.enable_memory:
         try:
             agent.memory = Memory(
@@ -56,14 +97,20 @@ def initialize_memory(agent) -> None:
             )
             agent.memory = None
             agent.enable_memory = False
+        else:
+            agent._memory_interval = agent.memory.config.memory_interval
+            agent._next_memory_step = _next_memory_step(agent.state.n_steps, agent._memory_interval)
     else:
         agent.memory = None
 
 
 def maybe_create_procedural_memory(agent) -> None:
-    if (
-        agent.enable_memory
-        and agent.memory
-        and agent.state.n_steps % agent.memory.config.memory_interval == 0
-    ):
-        agent.memory.create_procedural_memory(agent.state.n_steps)
+    # a precomputed threshold replaces the per-step ``n_steps % memory_interval`` check. n_steps only
+    # grows by one per step, so the threshold is hit exactly; a retried step with the same n_steps does
+    # not fire again. Call initialize_memory() again after replacing agent.state.
+    n_steps = agent.state.n_steps
+    if n_steps < agent._next_memory_step:
+        return
+    agent._next_memory_step = _next_memory_step(n_steps + 1, agent._memory_interval)
+    if agent.enable_memory and agent.memory:
+        agent.memory.create_procedural_memory(n_steps)
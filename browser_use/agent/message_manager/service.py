@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import json
 import logging
+from collections.abc import Iterator
+from itertools import islice
 
 from browser_use.agent.message_manager.views import (
 	MessageMetadata,
@@ -349,6 +351,10 @@ Next Goal: {model_output.current_state.next_goal}
 		self.last_input_messages = [m.message for m in self.state.history.messages]
 		return self.last_input_messages
 
+	def get_messages_view(self, skip: int = 0) -> Iterator[BaseMessage]:
+		"""Iterate over the current messages after the first ``skip``, without copying the history"""
+		return (m.message for m in islice(self.state.history.messages, skip, None))
+
 	def _add_message_with_type(
 		self,
 		message: BaseMessage,
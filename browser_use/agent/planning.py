@@ -3,28 +3,67 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
-import re
-
+from functools import lru_cache, partial
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, SkipValidation
 
 from browser_use.agent.prompts import PlannerPrompt
 from browser_use.exceptions import LLMException
 from browser_use.llm.base import BaseChatModel
-from browser_use.llm.messages import BaseMessage, UserMessage
-from browser_use.utils import time_execution_async
+from browser_use.llm.messages import BaseMessage, SystemMessage, UserMessage
+from browser_use.utils import CallCoalescer, time_execution_async
+
+try:
+	import orjson
+except ImportError:
+	orjson = None
 
 logger = logging.getLogger(__name__)
 
-THINK_TAGS = re.compile(r'<think>.*?</think>', re.DOTALL)
-STRAY_CLOSE_TAG = re.compile(r'.*?</think>', re.DOTALL)
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch the stdlib error either way
+if orjson is not None:
+	_loads = orjson.loads
+
+	def _dumps_pretty(obj: Any) -> str:
+		return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+else:
+	_loads = json.loads
+
+	def _dumps_pretty(obj: Any) -> str:
+		return json.dumps(obj, indent=2)
+
+
+@lru_cache(maxsize=32)
+def _build_planner_system_message(
+	all_actions: str, is_planner_reasoning: bool, extended_planner_system_prompt: str | None
+) -> SystemMessage | UserMessage:
+	"""Return the (shared, do-not-mutate) planner system message for these settings."""
+	return PlannerPrompt(all_actions).get_system_message(
+		is_planner_reasoning=is_planner_reasoning,
+		extended_planner_system_prompt=extended_planner_system_prompt,
+	)
+
+
+class Plan(BaseModel):
+	"""Structured plan returned by :class:`BrowserPlanner`."""
+
+	state_analysis: str | None = None
+	progress_evaluation: str | None = None
+	challenges: str | None = None
+	next_steps: str | None = None
+	reasoning: str | None = None
+	raw: str = Field(description='Raw plan text returned by the LLM')
+
+
+_PLAN_TEXT_FIELDS = frozenset(Plan.model_fields) - {'raw'}
 
 
 class PlannerContext(BaseModel):
-"""Context information required for generating plans."""
+	"""Context information required for generating plans."""
 
 	model_config = ConfigDict(arbitrary_types_allowed=True)
 
@@ -35,75 +74,161 @@ class PlannerContext(BaseModel):
 	extend_planner_system_message: str | None = Field(default=None, description='Additional system prompt text')
 	use_vision_for_planner: bool = Field(default=True, description='Allow images to be sent to the planner LLM')
 	use_vision: bool = Field(default=False, description='Whether image messages are included in messages')
-
-
-class Plan(BaseModel):
-"""Structured plan returned by :class:`BrowserPlanner`."""
-	
-	state_analysis: str | None = None
-	progress_evaluation: str | None = None
-	challenges: str | None = None
-	next_steps: str | None = None
-	reasoning: str | None = None
-raw: str = Field(description='Raw plan text returned by the LLM')
+	# SkipValidation keeps the caller's dict object, so plans stored by the planner are visible to the caller
+	plan_cache: SkipValidation[dict[str, Plan] | None] = Field(
+		default=None, description='Plans keyed by task + latest state, reused instead of calling the planner LLM'
+	)
 
 
 class BrowserPlanner:
 	"""Utility for generating high level plans."""
-	
+
 	def __init__(self, llm: BaseChatModel, *, logger: logging.Logger | None = None):
-	self.llm = llm
-	self.logger = logger or logging.getLogger(__name__)
-	
+		self.llm = llm
+		self.logger = logger or logging.getLogger(__name__)
+		self._needs_think_strip = _needs_think_strip(llm)
+
 	async def generate_plan(self, task: str, *, context: PlannerContext) -> Plan:
-	"""Generate a plan for ``task`` using the provided context."""
-	messages = [
-	PlannerPrompt(context.available_actions).get_system_message(
-	is_planner_reasoning=context.is_planner_reasoning,
-	extended_planner_system_prompt=context.extend_planner_system_message,
-	),
-	*context.messages,
-	]
-	
-	if not context.use_vision_for_planner and context.use_vision and messages:
-	last_state_message: UserMessage = messages[-1]  # type: ignore[assignment]
-	new_msg = ''
-	if isinstance(last_state_message.content, list):
-	for msg in last_state_message.content:
-	if msg.type == 'text':
-	new_msg += msg.text
-	else:
-	new_msg = last_state_message.content  # type: ignore[assignment]
-	messages[-1] = UserMessage(content=new_msg)
-	
-	try:
-	response = await self.llm.ainvoke(messages)
-	except Exception as e:
-	status_code = getattr(e, 'status_code', None) or getattr(e, 'code', None) or 500
-	self.logger.error(f'Failed to invoke planner: {e}')
-	raise LLMException(status_code, f'Planner LLM API call failed: {type(e).__name__}: {e}') from e
-	
-	plan_str = response.completion
-	if 'deepseek-r1' in self.llm.model or 'deepseek-reasoner' in self.llm.model:
-	plan_str = _remove_think_tags(self, plan_str)
-	
-	parsed: dict[str, Any] | None = None
+		"""Generate a plan for ``task`` using the provided context."""
+		cache_key = None
+		if context.plan_cache is not None:
+			cache_key = _plan_cache_key(task, context.messages)
+			cached = context.plan_cache.get(cache_key)
+			if cached is not None:
+				self.logger.debug('Reusing cached plan')
+				return cached
+
+		messages = [
+			_build_planner_system_message(
+				context.available_actions,
+				context.is_planner_reasoning,
+				context.extend_planner_system_message,
+			),
+			*context.messages,
+		]
+
+		if not context.use_vision_for_planner and context.use_vision and messages:
+			messages[-1] = _drop_images(messages[-1])  # type: ignore[arg-type]
+
+		plan_str = await _invoke_planner(self.llm, messages, self.logger, strip_think=self._needs_think_strip)
+		parsed = _parse_plan_output(plan_str, self.logger)
+
+		# Plan fields are optional strings, so keeping only known string-valued keys leaves nothing to validate
+		fields = {k: v for k, v in (parsed or {}).items() if k in _PLAN_TEXT_FIELDS and (v is None or isinstance(v, str))}
+		plan = Plan.model_construct(raw=plan_str, **fields)
+		if cache_key is not None:
+			context.plan_cache[cache_key] = plan  # type: ignore[index]
+		return plan
+
+
+class BatchingPlanner:
+	"""Group planner LLM calls that arrive within a short window and start them together.
+
+	Agents sharing a planner LLM call :meth:`invoke` independently; calls that land within
+	``window_ms`` of the first pending one are started at the same time. Each is still its own
+	``ainvoke`` request, so this only aligns submission timing, and adds up to ``window_ms`` of latency per call.
+	"""
+
+	def __init__(self, llm: BaseChatModel, *, window_ms: float = 10, logger: logging.Logger | None = None):
+		self.llm = llm
+		self.window_ms = window_ms
+		self.logger = logger or logging.getLogger(__name__)
+		self._needs_think_strip = _needs_think_strip(llm)
+		self._coalescer = CallCoalescer(window_ms)
+
+	@classmethod
+	def for_llm(cls, llm: BaseChatModel, window_ms: float) -> BatchingPlanner:
+		"""Return the batcher shared by every caller of ``llm`` with this ``window_ms``, creating it on first use."""
+		batchers: dict[float, BatchingPlanner] | None = getattr(llm, '_batching_planners', None)
+		if batchers is None:
+			batchers = {}
+			setattr(llm, '_batching_planners', batchers)
+		batcher = batchers.get(window_ms)
+		if batcher is None:
+			batcher = batchers[window_ms] = cls(llm, window_ms=window_ms)
+		return batcher
+
+	async def invoke(self, messages: list[BaseMessage]) -> str:
+		"""Queue ``messages`` for the next batch and return the planner output for them."""
+		return await self._coalescer.submit(
+			partial(_invoke_planner, self.llm, messages, self.logger, strip_think=self._needs_think_strip)
+		)
+
+
+def _drop_images(message: UserMessage) -> UserMessage:
+	"""Return the text of a state message without its image parts, for planners that run without vision."""
+	content = message.content
+	if isinstance(content, str):
+		return UserMessage(content=content)
+	return UserMessage(content=''.join(part.text for part in content if part.type == 'text'))
+
+
+def _needs_think_strip(llm: BaseChatModel) -> bool:
+	"""Whether ``llm`` is a reasoning model that wraps its output in <think> tags."""
+	return 'deepseek-r1' in llm.model or 'deepseek-reasoner' in llm.model
+
+
+async def _invoke_planner(llm: BaseChatModel, messages: list[BaseMessage], logger: logging.Logger, *, strip_think: bool) -> str:
+	"""Call the planner LLM and return its output, with reasoning tags removed if ``strip_think``."""
 	try:
-	parsed = json.loads(plan_str)
-	self.logger.info(f'Planning Analysis:\n{json.dumps(parsed, indent=4)}')
-	except json.JSONDecodeError:
-	self.logger.info(f'Planning Analysis:\n{plan_str}')
+		response = await llm.ainvoke(messages)
 	except Exception as e:
-	self.logger.debug(f'Error parsing planning analysis: {e}')
-	self.logger.info(f'Plan: {plan_str}')
-	
-	plan_data = parsed if isinstance(parsed, dict) else {}
-	return Plan(raw=plan_str, **plan_data)
-
-
-def _remove_think_tags(self, text: str) -> str:
-    text = re.sub(THINK_TAGS, '', text)
-    text = re.sub(STRAY_CLOSE_TAG, '', text)
-    return text.strip()
-
+		# Extract status code if available (e.g., from HTTP exceptions)
+		status_code = getattr(e, 'status_code', None) or getattr(e, 'code', None) or 500
+		logger.error(f'Failed to invoke planner: {e}')
+		raise LLMException(status_code, f'Planner LLM API call failed: {type(e).__name__}: {e}') from e
 
+	plan_str = response.completion
+	# if deepseek-reasoner, remove think tags
+	if strip_think:
+		plan_str = _remove_think_tags(plan_str)
+	return plan_str
+
+
+def _parse_plan_output(plan_str: str, logger: logging.Logger) -> dict[str, Any] | None:
+	"""Parse a JSON-object plan (``None`` otherwise) and log the planning analysis."""
+	parsed: Any = None
+	# only a JSON object can fill the Plan fields; skip the parse (and its exception) for reasoning-style output
+	if plan_str.lstrip().startswith('{'):
+		try:
+			parsed = _loads(plan_str)
+		except json.JSONDecodeError:
+			pass
+		except Exception as e:
+			logger.debug(f'Error parsing planning analysis: {e}')
+	if not isinstance(parsed, dict):
+		parsed = None
+	if logger.isEnabledFor(logging.INFO):
+		if parsed is not None:
+			logger.info(f'Planning Analysis:\n{_dumps_pretty(parsed)}')
+		else:
+			logger.info(f'Planning Analysis:\n{plan_str}')
+	return parsed
+
+
+def _plan_cache_key(task: str, messages: list[BaseMessage]) -> str:
+	"""Exact-match key for a plan: the task plus the text of the latest message."""
+	last_text = getattr(messages[-1], 'text', '') if messages else ''
+	return hashlib.blake2b(f'{task}\x00{last_text}'.encode(), digest_size=16).hexdigest()
+
+
+def _remove_think_tags(text: str) -> str:
+	# most responses have no reasoning block at all
+	if '</think>' not in text:
+		return text.strip()
+	# Step 1: Remove well-formed <think>...</think> with a linear str.find scan
+	#         (same result as a non-greedy regex, without backtracking).
+	parts = []
+	pos = 0
+	while (start := text.find('<think>', pos)) != -1:
+		end = text.find('</think>', start + len('<think>'))
+		if end == -1:
+			break
+		parts.append(text[pos:start])
+		pos = end + len('</think>')
+	parts.append(text[pos:])
+	text = ''.join(parts)
+	# Step 2: If there's an unmatched closing tag </think>,
+	#         remove everything up to and including that.
+	text = text.rpartition('</think>')[2]
+	return text.strip()
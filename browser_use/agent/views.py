@@ -56,6 +56,7 @@ class AgentSettings(BaseModel):
 	page_extraction_llm: BaseChatModel | None = None
 	planner_llm: BaseChatModel | None = None
 	planner_interval: int = 1  # Run planner every N steps
+	planner_batch_window_ms: float = 0  # Coalesce planner calls from agents sharing planner_llm (0 = off)
 	is_planner_reasoning: bool = False  # type: ignore
 	extend_planner_system_message: str | None = None
 	calculate_cost: bool = False
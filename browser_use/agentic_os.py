@@ -1,34 +1,120 @@
 # @file purpose: load agentic OS settings from YAML
 """Loader for agentic OS configuration."""
 
+import hashlib
+import json
 import os
+from collections import OrderedDict
 from pathlib import Path
 
-import yaml
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, ValidationError
+
+from browser_use.config import CONFIG
+
+try:
+	from orjson import loads as _json_loads
+except ImportError:
+	_json_loads = json.loads
 
 
 class AgenticOSConfig(BaseModel):
 	"""Settings loaded from ``agentic_os.yaml``."""
 
+	# frozen so loaded configs can be shared from the cache without copying
+	model_config = ConfigDict(frozen=True)
+
 	planner_model: str | None = None
 	memory_backend: str | None = None
 	toolhub_endpoint: str | None = None
 
 
-DEFAULT_CONFIG_PATH = Path(os.getenv('AGENTIC_OS_CONFIG', 'agentic_os.yaml'))
+def _default_config_path() -> Path:
+	"""Path from ``AGENTIC_OS_CONFIG``, read at call time so later changes to the env are honoured."""
+	return Path(os.getenv('AGENTIC_OS_CONFIG', 'agentic_os.yaml'))
+
+
+DEFAULT_CONFIG_PATH = _default_config_path()
+
+
+_CACHE_MAX_ENTRIES = 100
+# resolved path -> (mtime_ns, size, config); least recently used first
+_config_cache: OrderedDict[str, tuple[int, int, AgenticOSConfig]] = OrderedDict()
+
+
+def _json_cache_path(path: Path) -> Path:
+	"""Sidecar location for ``path``: under the user cache dir, never next to the user's own files."""
+	digest = hashlib.blake2b(str(path.resolve()).encode(), digest_size=16).hexdigest()
+	return CONFIG.XDG_CACHE_HOME / 'browseruse' / 'agentic_os' / f'{digest}.json'
+
+
+def _read_json_cache(path: Path, st: os.stat_result) -> AgenticOSConfig | None:
+	"""Return the config from ``path``'s JSON sidecar if it was built from the current file."""
+	try:
+		payload = _json_loads(_json_cache_path(path).read_bytes())
+	except (OSError, ValueError):
+		return None
+	# the sidecar records the source stat instead of relying on mtime ordering, which coarse timestamps can break
+	if not isinstance(payload, dict) or (payload.get('mtime_ns'), payload.get('size')) != (st.st_mtime_ns, st.st_size):
+		return None
+	# the sidecar may be stale or hand-edited, so a malformed one is a cache miss rather than an error
+	try:
+		return AgenticOSConfig.model_validate(payload['data'])
+	except (KeyError, TypeError, ValidationError):
+		return None
+
+
+def _write_json_cache(path: Path, st: os.stat_result, config: AgenticOSConfig) -> None:
+	"""Write ``config`` to the JSON sidecar of ``path``; best effort, e.g. the directory may be read-only."""
+	cache_path = _json_cache_path(path)
+	tmp_path = cache_path.with_name(f'{cache_path.name}.{os.getpid()}.tmp')
+	payload = {'mtime_ns': st.st_mtime_ns, 'size': st.st_size, 'data': config.model_dump(mode='json')}
+	try:
+		cache_path.parent.mkdir(parents=True, exist_ok=True)
+		tmp_path.write_text(json.dumps(payload, separators=(',', ':')))
+		os.replace(tmp_path, cache_path)
+	except OSError:
+		tmp_path.unlink(missing_ok=True)
+
+
+def _load_config_file(path: Path, st: os.stat_result) -> AgenticOSConfig:
+	"""Parse ``path`` into a config."""
+	# both parsers take bytes directly, which skips the text-stream codec layer
+	if path.suffix == '.json':
+		data = _json_loads(path.read_bytes())
+	else:
+		config = _read_json_cache(path, st)
+		if config is not None:
+			return config
+		# yaml is only imported when a config file actually exists
+		import yaml
+
+		loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)  # CSafeLoader needs PyYAML built with libyaml
+		data = yaml.load(path.read_bytes(), Loader=loader) or {}
+	config = AgenticOSConfig(**data) if isinstance(data, dict) else AgenticOSConfig()
+	if path.suffix != '.json':
+		# YAML parsing dominates load time; later processes read the JSON sidecar instead
+		_write_json_cache(path, st, config)
+	return config
 
 
 def load_agentic_os_config(path: str | Path | None = None) -> AgenticOSConfig:
-	"""Load agentic OS settings from a YAML file."""
-	cfg_path = Path(path) if path else DEFAULT_CONFIG_PATH
+	"""Load agentic OS settings from a YAML (or ``.json``) file."""
+	cfg_path = Path(path) if path else _default_config_path()
 	if not cfg_path.is_file():
-	    return AgenticOSConfig()
-	with cfg_path.open() as f:
-	    data = yaml.safe_load(f) or {}
-	if not isinstance(data, dict):
-	    return AgenticOSConfig()
-	return AgenticOSConfig(**data)
+		return AgenticOSConfig()
+	st = cfg_path.stat()
+	key = str(cfg_path.resolve())
+	cached = _config_cache.get(key)
+	if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+		_config_cache.move_to_end(key)
+		return cached[2]
+
+	config = _load_config_file(cfg_path, st)
+	_config_cache[key] = (st.st_mtime_ns, st.st_size, config)
+	_config_cache.move_to_end(key)
+	if len(_config_cache) > _CACHE_MAX_ENTRIES:
+		_config_cache.popitem(last=False)
+	return config
 
 
 AGENTIC_OS_CONFIG = load_agentic_os_config()
@@ -301,7 +301,7 @@ class Registry(Generic[Context]):
 				domains=final_domains,
 				page_filter=page_filter,
 			)
-			self.registry.actions[func.__name__] = action
+			self.registry.register(action)
 
 			# Return the normalized function so it can be called with kwargs
 			return normalized_func
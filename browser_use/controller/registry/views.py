@@ -1,7 +1,8 @@
 from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
+from urllib.parse import urlparse
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, PrivateAttr
 
 from browser_use.browser import BrowserSession
 from browser_use.browser.types import Page
@@ -78,6 +79,31 @@ class ActionRegistry(BaseModel):
 
 	actions: dict[str, RegisteredAction] = {}
 
+	# bumped by register(); keys the per-origin description cache so new actions invalidate it
+	_version: int = PrivateAttr(default=0)
+	# (version, action count, url origin) -> (domain-matched filtered actions, description if no page_filter applies)
+	_page_description_cache: dict[tuple[int, int, str], tuple[list[RegisteredAction], str | None]] = PrivateAttr(
+		default_factory=dict
+	)
+
+	# (version, action count, description) for the unfiltered system prompt actions
+	_system_description: tuple[int, int, str] | None = PrivateAttr(default=None)
+
+	def register(self, action: RegisteredAction) -> None:
+		"""Add or replace ``action`` and invalidate cached prompt descriptions"""
+		self.actions[action.name] = action
+		self._version += 1
+		self._page_description_cache.clear()
+		self._system_description = None
+
+	@staticmethod
+	def _url_origin(url: str) -> str:
+		"""Domain matching only looks at scheme and hostname, so URLs sharing both share a cache entry"""
+		parsed = urlparse(url)
+		if not parsed.hostname:
+			return url
+		return f'{parsed.scheme.lower()}://{parsed.hostname.lower()}'
+
 	@staticmethod
 	def _match_domains(domains: list[str] | None, url: str) -> bool:
 		"""
@@ -121,27 +147,43 @@ class ActionRegistry(BaseModel):
 			- If page is provided: return only filtered actions that match the current page (excluding unfiltered actions)
 		"""
 		if page is None:
-			# For system prompt (no page provided), include only actions with no filters
-			return '\n'.join(
+			# For system prompt (no page provided), include only actions with no filters.
+			# The joined string only changes when actions are registered, so build it once per version.
+			cached = self._system_description
+			if cached is not None and cached[:2] == (self._version, len(self.actions)):
+				return cached[2]
+			description = '\n'.join(
 				action.prompt_description()
 				for action in self.actions.values()
 				if action.page_filter is None and action.domains is None
 			)
+			self._system_description = (self._version, len(self.actions), description)
+			return description
 
 		# only include filtered actions for the current page
-		filtered_actions = []
-		for action in self.actions.values():
-			if not (action.domains or action.page_filter):
+		key = (self._version, len(self.actions), self._url_origin(page.url))
+		cached = self._page_description_cache.get(key)
+		if cached is None:
+			domain_actions = [
+				action
+				for action in self.actions.values()
 				# skip actions with no filters, they are already included in the system prompt
-				continue
-
-			domain_is_allowed = self._match_domains(action.domains, page.url)
-			page_is_allowed = self._match_page_filter(action.page_filter, page)
-
-			if domain_is_allowed and page_is_allowed:
-				filtered_actions.append(action)
-
-		return '\n'.join(action.prompt_description() for action in filtered_actions)
+				if (action.domains or action.page_filter) and self._match_domains(action.domains, page.url)
+			]
+			# page filters are arbitrary callables on the page, so only a result without them can be reused as-is
+			description = None
+			if not any(action.page_filter for action in domain_actions):
+				description = '\n'.join(action.prompt_description() for action in domain_actions)
+			if len(self._page_description_cache) >= 256:
+				self._page_description_cache.clear()
+			cached = self._page_description_cache[key] = (domain_actions, description)
+
+		domain_actions, description = cached
+		if description is not None:
+			return description
+		return '\n'.join(
+			action.prompt_description() for action in domain_actions if self._match_page_filter(action.page_filter, page)
+		)
 
 
 class SpecialActionParameters(BaseModel):
@@ -1,10 +1,9 @@
 """Tool specifications for controller actions."""
 
-from pydantic import BaseModel, create_model
+from pydantic import BaseModel
 
 from agentic_os.tools import ToolSpec
 import agentic_os.tools as agentic_tools
-from browser_use.controller.service import Controller
 from browser_use.agent.views import ActionResult
 from browser_use.controller.views import (
     ClickElementAction,
@@ -21,12 +20,18 @@ from browser_use.controller.views import (
     SwitchTabAction,
 )
 
-_controller = Controller()
+_controller = None
 
 
 def _func(name: str):
-	"""Return the controller action callable."""
-	return _controller.registry.registry.actions[name].function
+    """Return the controller action callable."""
+    global _controller
+    if _controller is None:
+        # building the Controller pulls in the browser stack, so defer it until specs are needed
+        from browser_use.controller.service import Controller
+
+        _controller = Controller()
+    return _controller.registry.registry.actions[name].function
 
 
 class WaitParams(BaseModel):
@@ -40,322 +45,293 @@ class EmptyParams(NoParamsAction):
     pass
 
 
-# Register tool specs ---------------------------------------------------------
-agentic_tools.register_spec(
-    ToolSpec(
-        id="done",
-        description=(
-            "Complete task - provide a summary of results for the user. "
-            "Set success=True if task completed successfully, false otherwise. "
-            "Text should be your response to the user summarizing results. "
-            "Include files you would like to display to the user in files_to_display."
-        ),
-        input_model=DoneAction,
-        output_model=ActionResult,
-		func=_func("done"),
-    )
-)
+# Parameter models for actions without a matching controller model. These are
+# plain classes rather than create_model() calls so importing the module stays cheap.
+class ExtractStructuredDataParams(BaseModel):
+    query: str
 
-agentic_tools.register_spec(
-    ToolSpec(
-        id="search_google",
-        description=(
-            "Search the query in Google, the query should be a search query "
-            "like humans search in Google, concrete and not vague or super long."
-        ),
-        input_model=SearchGoogleAction,
-        output_model=ActionResult,
-		func=_func("search_google"),
-    )
-)
 
-agentic_tools.register_spec(
-    ToolSpec(
-        id="go_to_url",
-        description="Navigate to URL in the current tab",
-        input_model=GoToUrlAction,
-        output_model=ActionResult,
-		func=_func("go_to_url"),
-    )
-)
+class GetAxTreeParams(BaseModel):
+    number_of_elements: int
 
-agentic_tools.register_spec(
-    ToolSpec(
-        id="go_back",
-        description="Go back",
-        input_model=NoParamsAction,
-        output_model=ActionResult,
-		func=_func("go_back"),
-    )
-)
 
-agentic_tools.register_spec(
-    ToolSpec(
-        id="wait",
-        description="Wait for x seconds default 3",
-        input_model=WaitParams,
-        output_model=ActionResult,
-		func=_func("wait"),
-    )
-)
+class ScrollToTextParams(BaseModel):
+    text: str
 
-agentic_tools.register_spec(
-    ToolSpec(
-        id="click_element_by_index",
-        description="Click element by index",
-        input_model=ClickElementAction,
-        output_model=ActionResult,
-		func=_func("click_element_by_index"),
-    )
-)
 
-agentic_tools.register_spec(
-    ToolSpec(
-        id="input_text",
-        description="Click and input text into a input interactive element",
-        input_model=InputTextAction,
-        output_model=ActionResult,
-		func=_func("input_text"),
-    )
-)
+class WriteFileParams(BaseModel):
+    file_name: str
+    content: str
 
-agentic_tools.register_spec(
-    ToolSpec(
-        id="save_pdf",
-        description="Save the current page as a PDF file",
-        input_model=EmptyParams,
-        output_model=ActionResult,
-		func=_func("save_pdf"),
-    )
-)
 
-agentic_tools.register_spec(
-    ToolSpec(
-        id="switch_tab",
-        description="Switch tab",
-        input_model=SwitchTabAction,
-        output_model=ActionResult,
-		func=_func("switch_tab"),
-    )
-)
+class AppendFileParams(BaseModel):
+    file_name: str
+    content: str
 
-agentic_tools.register_spec(
-    ToolSpec(
-        id="open_tab",
-        description="Open a specific url in new tab",
-        input_model=OpenTabAction,
-        output_model=ActionResult,
-		func=_func("open_tab"),
-    )
-)
 
-agentic_tools.register_spec(
-    ToolSpec(
-        id="close_tab",
-        description="Close an existing tab",
-        input_model=CloseTabAction,
-        output_model=ActionResult,
-		func=_func("close_tab"),
-    )
-)
+class ReadFileParams(BaseModel):
+    file_name: str
 
-agentic_tools.register_spec(
-    ToolSpec(
-        id="extract_structured_data",
-        description=(
-            "Extract structured, semantic data (e.g. product description, price, "
-            "all information about XYZ) from the current webpage based on a textual "
-            "query. Only use this for extracting info from a single product/article "
-            "page, not for entire listings or search results pages."
-        ),
-        input_model=create_model("ExtractStructuredDataParams", query=(str, ...)),
-        output_model=ActionResult,
-		func=_func("extract_structured_data"),
-    )
-)
 
-agentic_tools.register_spec(
-    ToolSpec(
-        id="get_ax_tree",
-        description=(
-            "Get the accessibility tree of the page in the format 'role name' with "
-            "the number_of_elements to return"
-        ),
-        input_model=create_model("GetAxTreeParams", number_of_elements=(int, ...)),
-        output_model=ActionResult,
-		func=_func("get_ax_tree"),
-    )
-)
+class GetDropdownOptionsParams(BaseModel):
+    index: int
 
-agentic_tools.register_spec(
-    ToolSpec(
-        id="scroll_down",
-        description="Scroll down the page by pixel amount - if none is given, scroll one page",
-        input_model=ScrollAction,
-        output_model=ActionResult,
-		func=_func("scroll_down"),
-    )
-)
 
-agentic_tools.register_spec(
-    ToolSpec(
-        id="scroll_up",
-        description="Scroll up the page by pixel amount - if none is given, scroll one page",
-        input_model=ScrollAction,
-        output_model=ActionResult,
-		func=_func("scroll_up"),
-    )
-)
+class SelectDropdownOptionParams(BaseModel):
+    index: int
+    text: str
 
-agentic_tools.register_spec(
-    ToolSpec(
-        id="send_keys",
-        description=(
-            "Send strings of special keys like Escape,Backspace, Insert, PageDown, "
-            "Delete, Enter, shortcuts such as Control+o, Control+Shift+T are supported."
-        ),
-        input_model=SendKeysAction,
-        output_model=ActionResult,
-		func=_func("send_keys"),
-    )
-)
 
-agentic_tools.register_spec(
-    ToolSpec(
-        id="scroll_to_text",
-        description="If you dont find something which you want to interact with, scroll to it",
-        input_model=create_model("ScrollToTextParams", text=(str, ...)),
-        output_model=ActionResult,
-		func=_func("scroll_to_text"),
-    )
-)
+class ReadCellContentsParams(BaseModel):
+    cell_or_range: str
 
-agentic_tools.register_spec(
-    ToolSpec(
-        id="write_file",
-        description="Write content to file_name in file system, use only .md or .txt extensions.",
-        input_model=create_model(
-            "WriteFileParams", file_name=(str, ...), content=(str, ...)
-        ),
-        output_model=ActionResult,
-		func=_func("write_file"),
-    )
-)
 
-agentic_tools.register_spec(
-    ToolSpec(
-        id="append_file",
-        description="Append content to file_name in file system",
-        input_model=create_model(
-            "AppendFileParams", file_name=(str, ...), content=(str, ...)
-        ),
-        output_model=ActionResult,
-		func=_func("append_file"),
-    )
-)
+class UpdateCellContentsParams(BaseModel):
+    cell_or_range: str
+    new_contents_tsv: str
 
-agentic_tools.register_spec(
-    ToolSpec(
-        id="read_file",
-        description="Read file_name from file system",
-        input_model=create_model("ReadFileParams", file_name=(str, ...)),
-        output_model=ActionResult,
-		func=_func("read_file"),
-    )
-)
 
-agentic_tools.register_spec(
-    ToolSpec(
-        id="get_dropdown_options",
-        description="Get all options from a native dropdown",
-        input_model=create_model("GetDropdownOptionsParams", index=(int, ...)),
-        output_model=ActionResult,
-		func=_func("get_dropdown_options"),
-    )
-)
+class ClearCellContentsParams(BaseModel):
+    cell_or_range: str
 
-agentic_tools.register_spec(
-    ToolSpec(
-        id="select_dropdown_option",
-        description="Select dropdown option for interactive element index by the text of the option you want to select",
-        input_model=create_model(
-            "SelectDropdownOptionParams", index=(int, ...), text=(str, ...)
-        ),
-        output_model=ActionResult,
-		func=_func("select_dropdown_option"),
-    )
-)
 
-agentic_tools.register_spec(
-    ToolSpec(
-        id="drag_drop",
-        description="Drag and drop elements or between coordinates on the page - useful for canvas drawing, sortable lists, sliders, file uploads, and UI rearrangement",
-        input_model=DragDropAction,
-        output_model=ActionResult,
-		func=_func("drag_drop"),
-    )
-)
+class SelectCellOrRangeParams(BaseModel):
+    cell_or_range: str
 
-agentic_tools.register_spec(
-    ToolSpec(
-        id="read_sheet_contents",
-        description="Google Sheets: Get the contents of the entire sheet",
-        input_model=EmptyParams,
-        output_model=ActionResult,
-		func=_func("read_sheet_contents"),
-    )
-)
 
-agentic_tools.register_spec(
-    ToolSpec(
-        id="read_cell_contents",
-        description="Google Sheets: Get the contents of a cell or range of cells",
-        input_model=create_model("ReadCellContentsParams", cell_or_range=(str, ...)),
-        output_model=ActionResult,
-		func=_func("read_cell_contents"),
-    )
-)
+class FallbackInputParams(BaseModel):
+    text: str
+
 
-agentic_tools.register_spec(
-    ToolSpec(
-        id="update_cell_contents",
-        description="Google Sheets: Update the content of a cell or range of cells",
-        input_model=create_model(
-            "UpdateCellContentsParams",
-            cell_or_range=(str, ...),
-            new_contents_tsv=(str, ...),
+# Register tool specs ---------------------------------------------------------
+def _register_all() -> None:
+    specs = (
+        ToolSpec(
+            id="done",
+            description=(
+                "Complete task - provide a summary of results for the user. "
+                "Set success=True if task completed successfully, false otherwise. "
+                "Text should be your response to the user summarizing results. "
+                "Include files you would like to display to the user in files_to_display."
+            ),
+            input_model=DoneAction,
+            output_model=ActionResult,
+            func=_func("done"),
+        ),
+        ToolSpec(
+            id="search_google",
+            description=(
+                "Search the query in Google, the query should be a search query "
+                "like humans search in Google, concrete and not vague or super long."
+            ),
+            input_model=SearchGoogleAction,
+            output_model=ActionResult,
+            func=_func("search_google"),
+        ),
+        ToolSpec(
+            id="go_to_url",
+            description="Navigate to URL in the current tab",
+            input_model=GoToUrlAction,
+            output_model=ActionResult,
+            func=_func("go_to_url"),
+        ),
+        ToolSpec(
+            id="go_back",
+            description="Go back",
+            input_model=NoParamsAction,
+            output_model=ActionResult,
+            func=_func("go_back"),
+        ),
+        ToolSpec(
+            id="wait",
+            description="Wait for x seconds default 3",
+            input_model=WaitParams,
+            output_model=ActionResult,
+            func=_func("wait"),
+        ),
+        ToolSpec(
+            id="click_element_by_index",
+            description="Click element by index",
+            input_model=ClickElementAction,
+            output_model=ActionResult,
+            func=_func("click_element_by_index"),
+        ),
+        ToolSpec(
+            id="input_text",
+            description="Click and input text into a input interactive element",
+            input_model=InputTextAction,
+            output_model=ActionResult,
+            func=_func("input_text"),
+        ),
+        ToolSpec(
+            id="save_pdf",
+            description="Save the current page as a PDF file",
+            input_model=EmptyParams,
+            output_model=ActionResult,
+            func=_func("save_pdf"),
+        ),
+        ToolSpec(
+            id="switch_tab",
+            description="Switch tab",
+            input_model=SwitchTabAction,
+            output_model=ActionResult,
+            func=_func("switch_tab"),
+        ),
+        ToolSpec(
+            id="open_tab",
+            description="Open a specific url in new tab",
+            input_model=OpenTabAction,
+            output_model=ActionResult,
+            func=_func("open_tab"),
+        ),
+        ToolSpec(
+            id="close_tab",
+            description="Close an existing tab",
+            input_model=CloseTabAction,
+            output_model=ActionResult,
+            func=_func("close_tab"),
+        ),
+        ToolSpec(
+            id="extract_structured_data",
+            description=(
+                "Extract structured, semantic data (e.g. product description, price, "
+                "all information about XYZ) from the current webpage based on a textual "
+                "query. Only use this for extracting info from a single product/article "
+                "page, not for entire listings or search results pages."
+            ),
+            input_model=ExtractStructuredDataParams,
+            output_model=ActionResult,
+            func=_func("extract_structured_data"),
+        ),
+        ToolSpec(
+            id="get_ax_tree",
+            description=(
+                "Get the accessibility tree of the page in the format 'role name' with "
+                "the number_of_elements to return"
+            ),
+            input_model=GetAxTreeParams,
+            output_model=ActionResult,
+            func=_func("get_ax_tree"),
+        ),
+        ToolSpec(
+            id="scroll_down",
+            description="Scroll down the page by pixel amount - if none is given, scroll one page",
+            input_model=ScrollAction,
+            output_model=ActionResult,
+            func=_func("scroll_down"),
+        ),
+        ToolSpec(
+            id="scroll_up",
+            description="Scroll up the page by pixel amount - if none is given, scroll one page",
+            input_model=ScrollAction,
+            output_model=ActionResult,
+            func=_func("scroll_up"),
+        ),
+        ToolSpec(
+            id="send_keys",
+            description=(
+                "Send strings of special keys like Escape,Backspace, Insert, PageDown, "
+                "Delete, Enter, shortcuts such as Control+o, Control+Shift+T are supported."
+            ),
+            input_model=SendKeysAction,
+            output_model=ActionResult,
+            func=_func("send_keys"),
+        ),
+        ToolSpec(
+            id="scroll_to_text",
+            description="If you dont find something which you want to interact with, scroll to it",
+            input_model=ScrollToTextParams,
+            output_model=ActionResult,
+            func=_func("scroll_to_text"),
+        ),
+        ToolSpec(
+            id="write_file",
+            description="Write content to file_name in file system, use only .md or .txt extensions.",
+            input_model=WriteFileParams,
+            output_model=ActionResult,
+            func=_func("write_file"),
+        ),
+        ToolSpec(
+            id="append_file",
+            description="Append content to file_name in file system",
+            input_model=AppendFileParams,
+            output_model=ActionResult,
+            func=_func("append_file"),
+        ),
+        ToolSpec(
+            id="read_file",
+            description="Read file_name from file system",
+            input_model=ReadFileParams,
+            output_model=ActionResult,
+            func=_func("read_file"),
+        ),
+        ToolSpec(
+            id="get_dropdown_options",
+            description="Get all options from a native dropdown",
+            input_model=GetDropdownOptionsParams,
+            output_model=ActionResult,
+            func=_func("get_dropdown_options"),
+        ),
+        ToolSpec(
+            id="select_dropdown_option",
+            description="Select dropdown option for interactive element index by the text of the option you want to select",
+            input_model=SelectDropdownOptionParams,
+            output_model=ActionResult,
+            func=_func("select_dropdown_option"),
+        ),
+        ToolSpec(
+            id="drag_drop",
+            description="Drag and drop elements or between coordinates on the page - useful for canvas drawing, sortable lists, sliders, file uploads, and UI rearrangement",
+            input_model=DragDropAction,
+            output_model=ActionResult,
+            func=_func("drag_drop"),
+        ),
+        ToolSpec(
+            id="read_sheet_contents",
+            description="Google Sheets: Get the contents of the entire sheet",
+            input_model=EmptyParams,
+            output_model=ActionResult,
+            func=_func("read_sheet_contents"),
+        ),
+        ToolSpec(
+            id="read_cell_contents",
+            description="Google Sheets: Get the contents of a cell or range of cells",
+            input_model=ReadCellContentsParams,
+            output_model=ActionResult,
+            func=_func("read_cell_contents"),
+        ),
+        ToolSpec(
+            id="update_cell_contents",
+            description="Google Sheets: Update the content of a cell or range of cells",
+            input_model=UpdateCellContentsParams,
+            output_model=ActionResult,
+            func=_func("update_cell_contents"),
+        ),
+        ToolSpec(
+            id="clear_cell_contents",
+            description="Google Sheets: Clear whatever cells are currently selected",
+            input_model=ClearCellContentsParams,
+            output_model=ActionResult,
+            func=_func("clear_cell_contents"),
+        ),
+        ToolSpec(
+            id="select_cell_or_range",
+            description="Google Sheets: Select a specific cell or range of cells",
+            input_model=SelectCellOrRangeParams,
+            output_model=ActionResult,
+            func=_func("select_cell_or_range"),
+        ),
+        ToolSpec(
+            id="fallback_input_into_single_selected_cell",
+            description="Google Sheets: Fallback method to type text into (only one) currently selected cell",
+            input_model=FallbackInputParams,
+            output_model=ActionResult,
+            func=_func("fallback_input_into_single_selected_cell"),
         ),
-        output_model=ActionResult,
-		func=_func("update_cell_contents"),
     )
-)
 
-agentic_tools.register_spec(
-    ToolSpec(
-        id="clear_cell_contents",
-        description="Google Sheets: Clear whatever cells are currently selected",
-        input_model=create_model("ClearCellContentsParams", cell_or_range=(str, ...)),
-        output_model=ActionResult,
-		func=_func("clear_cell_contents"),
-    )
-)
+    for spec in specs:
+        agentic_tools.register_spec(spec)
 
-agentic_tools.register_spec(
-    ToolSpec(
-        id="select_cell_or_range",
-        description="Google Sheets: Select a specific cell or range of cells",
-        input_model=create_model("SelectCellOrRangeParams", cell_or_range=(str, ...)),
-        output_model=ActionResult,
-		func=_func("select_cell_or_range"),
-    )
-)
 
-agentic_tools.register_spec(
-    ToolSpec(
-        id="fallback_input_into_single_selected_cell",
-        description="Google Sheets: Fallback method to type text into (only one) currently selected cell",
-        input_model=create_model("FallbackInputParams", text=(str, ...)),
-        output_model=ActionResult,
-		func=_func("fallback_input_into_single_selected_cell"),
-    )
-)
+agentic_tools.register_lazy(_register_all)
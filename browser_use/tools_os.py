@@ -2,7 +2,8 @@
 """Tool specifications for general OS operations.
 
 Executing shell commands can be dangerous if user input is passed directly to
-the shell. ``ShellCommandParams`` performs basic validation and rejects commands
+the shell. Commands are therefore split with :func:`shlex.split` and executed
+without a shell, and ``ShellCommandParams`` additionally rejects commands
 containing common shell control characters to reduce the risk of command
 injection. This validation is not a guarantee of safety, so never execute
 commands from an untrusted source without additional precautions.
@@ -11,9 +12,12 @@ commands from an untrusted source without additional precautions.
 from __future__ import annotations
 
 import os
+import re
+import shlex
 import signal
 import subprocess
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, Any, Optional, Self
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -21,48 +25,146 @@ from agentic_os.tools import ToolSpec
 import agentic_os.tools as agentic_tools
 from browser_use.agent.views import ActionResult
 
+try:
+    import re2 as _re_engine  # type: ignore[import-not-found]
+except ImportError:
+    _re_engine = re
+
 # Characters that should not appear in a shell command for safety
 _DISALLOWED_SHELL_CHARS = {";", "|", "&", "`", "$", ">", "<"}
+# Single C-level scan of the command instead of one substring test per character.
+# google-re2, when installed, compiles this to a DFA; stdlib re is the fallback.
+_DISALLOWED_SHELL_RE = _re_engine.compile(
+    "[" + re.escape("".join(sorted(_DISALLOWED_SHELL_CHARS))) + "]"
+)
+
+
+class _OSToolParams(BaseModel):
+    """Base for the OS tool parameter models."""
 
+    @classmethod
+    def trusted(cls, **data: Any) -> Self:
+        """Build params without validation, for arguments the caller has already vetted.
+
+        Field validators (including the shell character check) are skipped, so never
+        pass user- or LLM-supplied values here; use the regular constructor for those.
+        """
+        return cls.model_construct(**data)
 
-class ShellCommandParams(BaseModel):
+
+class ShellCommandParams(_OSToolParams):
     """Parameters for run_shell_command."""
 
     command: str = Field(description="Command to execute in the shell")
+    max_output_bytes: int = Field(
+        1_048_576,
+        gt=0,
+        description="Maximum bytes of stdout+stderr to return; each stream is also held to this much while reading",
+    )
 
     @field_validator("command")
     @classmethod
     def _validate_command(cls, v: str) -> str:
-        if any(ch in v for ch in _DISALLOWED_SHELL_CHARS):
+        if _DISALLOWED_SHELL_RE.search(v):
             raise ValueError(
                 "Command contains unsafe characters; disallowed: ; | & ` $ > <"
             )
         return v
 
 
+_PIPE_CHUNK_BYTES = 65536
+
+
+def _read_capped(stream: IO[bytes], max_bytes: int) -> tuple[bytes, int]:
+    """Read ``stream`` to EOF keeping only its first ``max_bytes``; the rest is drained and counted."""
+    kept = bytearray()
+    total = 0
+    while chunk := stream.read1(_PIPE_CHUNK_BYTES):  # type: ignore[attr-defined]
+        total += len(chunk)
+        room = max_bytes - len(kept)
+        if room > 0:
+            kept += chunk[:room]
+    return bytes(kept), total
+
+
+def _join_output(stdout: bytes, stderr: bytes, max_bytes: int, total: int) -> str:
+    """Join stdout and stderr, keeping at most ``max_bytes`` (stdout first); ``total`` is the full output size."""
+    if total <= max_bytes:
+        return b"".join((stdout, stderr)).decode("utf-8", errors="replace")
+    stdout = stdout[:max_bytes]
+    stderr = stderr[: max_bytes - len(stdout)]
+    output = b"".join((stdout, stderr)).decode("utf-8", errors="replace")
+    return f"{output}\n... [truncated: showing {max_bytes} of {total} bytes]"
+
+
 def run_shell_command(params: ShellCommandParams) -> ActionResult:
     """Execute a shell command and return stdout/stderr."""
     try:
-        completed = subprocess.run(
-            params.command, shell=True, check=False, capture_output=True, text=True
+        with subprocess.Popen(
+            shlex.split(params.command), stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        ) as proc:
+            # read both pipes as the command writes them, each capped at max_output_bytes, so peak
+            # memory stays bounded however much the command prints; stderr gets its own thread so
+            # neither pipe can fill up and block the child
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                stderr_future = pool.submit(
+                    _read_capped, proc.stderr, params.max_output_bytes
+                )
+                stdout, stdout_total = _read_capped(
+                    proc.stdout, params.max_output_bytes
+                )
+                stderr, stderr_total = stderr_future.result()
+            proc.wait()
+        output = _join_output(
+            stdout, stderr, params.max_output_bytes, stdout_total + stderr_total
         )
-        output = completed.stdout + completed.stderr
         return ActionResult(extracted_content=output, include_in_memory=True)
     except Exception as e:  # pragma: no cover - safeguard
         return ActionResult(error=str(e), include_in_memory=True)
 
 
-class FilePathParams(BaseModel):
+class FilePathParams(_OSToolParams):
     """Parameters for file path operations."""
 
     path: str = Field(description="Path on the local filesystem")
+    max_bytes: int = Field(
+        1_048_576, gt=0, description="Maximum number of bytes to read from a file"
+    )
+
+
+def _read_bounded(fd: int, max_bytes: int) -> bytes:
+    """Read up to ``max_bytes`` from ``fd``; ``os.read`` may return short reads."""
+    chunks = []
+    remaining = max_bytes
+    while remaining:
+        chunk = os.read(fd, remaining)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(chunks)
+
+
+def read_file_bytes(path: str, max_bytes: int = 1_048_576) -> tuple[bytes, int]:
+    """Return up to ``max_bytes`` of ``path`` undecoded, plus the file's full size.
+
+    For callers that forward file contents as-is; :func:`read_file` decodes them for the agent.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        return _read_bounded(fd, max_bytes), size
+    finally:
+        os.close(fd)
 
 
 def read_file(params: FilePathParams) -> ActionResult:
-    """Read a file from disk."""
+    """Read up to ``max_bytes`` of a file from disk."""
     try:
-        with open(params.path, "r", encoding="utf-8") as f:
-            data = f.read()
+        raw, size = read_file_bytes(params.path, params.max_bytes)
+        data = raw.decode("utf-8", errors="replace")
+        if size > params.max_bytes:
+            data += f"\n... [truncated: showing {params.max_bytes} of {size} bytes]"
         return ActionResult(extracted_content=data, include_in_memory=True)
     except Exception as e:  # pragma: no cover - simple wrapper
         return ActionResult(error=str(e), include_in_memory=True)
@@ -71,15 +173,16 @@ def read_file(params: FilePathParams) -> ActionResult:
 def list_directory(params: FilePathParams) -> ActionResult:
     """List contents of a directory."""
     try:
-        files = os.listdir(params.path)
-        return ActionResult(
-            extracted_content="\n".join(sorted(files)), include_in_memory=True
-        )
+        # scandir streams entries from the directory read; the context manager
+        # releases the directory fd as soon as the listing is consumed
+        with os.scandir(params.path) as entries:
+            names = sorted(entry.name for entry in entries)
+        return ActionResult(extracted_content="\n".join(names), include_in_memory=True)
     except Exception as e:  # pragma: no cover
         return ActionResult(error=str(e), include_in_memory=True)
 
 
-class ManageProcessParams(BaseModel):
+class ManageProcessParams(_OSToolParams):
     """Parameters for manage_process."""
 
     action: str = Field(description="'start' or 'stop'")
@@ -91,7 +194,7 @@ def manage_process(params: ManageProcessParams) -> ActionResult:
     """Start or stop a process."""
     try:
         if params.action == "start" and params.command:
-            proc = subprocess.Popen(params.command, shell=True)
+            proc = subprocess.Popen(shlex.split(params.command))
             return ActionResult(
                 extracted_content=f"Started process {proc.pid}",
                 long_term_memory=str(proc.pid),
@@ -109,49 +212,57 @@ def manage_process(params: ManageProcessParams) -> ActionResult:
 
 
 # Register tool specifications -------------------------------------------------
-agentic_tools.register_spec(
-    ToolSpec(
-        id="run_shell_command",
-        description="Run a shell command on the local OS and return output",
-        input_model=ShellCommandParams,
-        output_model=ActionResult,
-        func=run_shell_command,
+def _register_all() -> None:
+    agentic_tools.register_spec(
+        ToolSpec(
+            id="run_shell_command",
+            description="Run a shell command on the local OS and return output",
+            input_model=ShellCommandParams,
+            output_model=ActionResult,
+            func=run_shell_command,
+        )
     )
-)
 
-agentic_tools.register_spec(
-    ToolSpec(
-        id="read_os_file",
-        description="Read a file from the local OS",  # avoid collision with browser action
-        input_model=FilePathParams,
-        output_model=ActionResult,
-        func=read_file,
+    agentic_tools.register_spec(
+        ToolSpec(
+            id="read_os_file",
+            description="Read a file from the local OS",  # avoid collision with browser action
+            input_model=FilePathParams,
+            output_model=ActionResult,
+            func=read_file,
+        )
     )
-)
 
-agentic_tools.register_spec(
-    ToolSpec(
-        id="list_directory",
-        description="List contents of a directory on the local OS",
-        input_model=FilePathParams,
-        output_model=ActionResult,
-        func=list_directory,
+    agentic_tools.register_spec(
+        ToolSpec(
+            id="list_directory",
+            description="List contents of a directory on the local OS",
+            input_model=FilePathParams,
+            output_model=ActionResult,
+            func=list_directory,
+        )
     )
-)
 
-agentic_tools.register_spec(
-    ToolSpec(
-        id="manage_process",
-        description="Start or stop a process by pid or command",
-        input_model=ManageProcessParams,
-        output_model=ActionResult,
-        func=manage_process,
+    agentic_tools.register_spec(
+        ToolSpec(
+            id="manage_process",
+            description="Start or stop a process by pid or command",
+            input_model=ManageProcessParams,
+            output_model=ActionResult,
+            func=manage_process,
+        )
     )
+
+
+agentic_tools.register_lazy(
+    _register_all,
+    ids=("run_shell_command", "read_os_file", "list_directory", "manage_process"),
 )
 
 __all__ = [
     "run_shell_command",
     "read_file",
+    "read_file_bytes",
     "list_directory",
     "manage_process",
 ]
@@ -736,3 +736,59 @@ def retry(
 		return wrapper
 
 	return decorator
+
+
+class CallCoalescer:
+	"""Hold async calls for up to ``window_ms`` after the first pending one, then start them together.
+
+	Every call runs as its own task as soon as its group is released, so a call never waits on
+	calls from earlier groups; grouping only aligns submission and adds at most ``window_ms`` of latency.
+	"""
+
+	def __init__(self, window_ms: float):
+		self.window_ms = window_ms
+		self._pending: list[tuple[Callable[[], Coroutine[Any, Any, Any]], asyncio.Future[Any]]] = []
+		self._consumer: asyncio.Task[None] | None = None
+		# running calls, referenced so they are not garbage collected mid-flight
+		self._running: set[asyncio.Task[None]] = set()
+
+	async def submit(self, call: Callable[[], Coroutine[Any, Any, T]]) -> T:
+		"""Queue ``call`` for the next group and return its result (or raise its exception)."""
+		future: asyncio.Future[T] = asyncio.get_running_loop().create_future()
+		self._pending.append((call, future))
+		if self._consumer is None or self._consumer.done():
+			self._consumer = asyncio.create_task(self._consume())
+		return await future
+
+	async def _consume(self) -> None:
+		# runs while there is work and exits when idle; submit() restarts it
+		try:
+			while self._pending:
+				await asyncio.sleep(self.window_ms / 1000)
+				batch, self._pending = self._pending, []
+				for call, future in batch:
+					if future.done():  # caller was cancelled while waiting for the window
+						continue
+					task = asyncio.create_task(self._run(call, future))
+					self._running.add(task)
+					task.add_done_callback(self._running.discard)
+					# a caller that gives up cancels its call
+					future.add_done_callback(lambda f, task=task: task.cancel() if f.cancelled() else None)
+		except BaseException:
+			# the consumer itself was cancelled (e.g. loop shutdown): don't leave callers waiting forever
+			for _, future in self._pending:
+				future.cancel()
+			self._pending = []
+			raise
+
+	@staticmethod
+	async def _run(call: Callable[[], Coroutine[Any, Any, Any]], future: asyncio.Future[Any]) -> None:
+		try:
+			result = await call()
+		except BaseException as e:
+			# also hands BaseExceptions such as a CancelledError raised inside the call to the caller
+			if not future.done():
+				future.set_exception(e)
+		else:
+			if not future.done():
+				future.set_result(result)
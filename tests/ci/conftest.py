@@ -191,6 +191,18 @@ def mock_llm():
 	return create_mock_llm(actions=None)
 
 
+@pytest.fixture(scope='module')
+def _shared_async_mock():
+	return AsyncMock()
+
+
+@pytest.fixture(scope='function')
+def async_mock_llm(_shared_async_mock):
+	"""A bare AsyncMock LLM shared across a module's tests and reset after each one"""
+	yield _shared_async_mock
+	_shared_async_mock.reset_mock(return_value=True, side_effect=True)
+
+
 @pytest.fixture(scope='function')
 def agent_with_cloud(browser_session, mock_llm, cloud_sync):
 	"""Create agent with cloud sync enabled (using real CloudSync)."""
@@ -0,0 +1,69 @@
+"""Planner placement and failure handling within Agent.step()."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from browser_use import Agent
+from browser_use.agent.views import AgentStepInfo
+from browser_use.llm.messages import AssistantMessage, UserMessage
+from browser_use.llm.views import ChatInvokeCompletion
+from tests.ci.conftest import create_mock_llm
+
+
+def _agent_with_stubbed_step(planner_llm) -> tuple[Agent, list]:
+	"""Agent whose step() runs up to get_next_action without a browser; returns the messages sent to the LLM."""
+	agent = Agent(task='test task', llm=create_mock_llm(), planner_llm=planner_llm)
+	agent.browser_session = MagicMock()
+	agent.browser_session.get_state_summary = AsyncMock()
+	agent.browser_session.get_current_page = AsyncMock()
+	agent._log_step_context = lambda *args, **kwargs: None
+	agent._update_action_models_for_page = AsyncMock()
+	agent.controller.registry.get_prompt_description = lambda page=None: ''
+	agent._message_manager.add_state_message = lambda **kwargs: agent._message_manager._add_message_with_type(
+		UserMessage(content='STATE')
+	)
+
+	sent = []
+
+	async def get_next_action(input_messages):
+		sent.append(input_messages)
+		raise InterruptedError  # stop the step once the LLM input is known
+
+	agent.get_next_action = get_next_action
+	return agent, sent
+
+
+def _planner_llm(completion: str) -> AsyncMock:
+	llm = create_mock_llm()
+	llm.ainvoke = AsyncMock(return_value=ChatInvokeCompletion(completion=completion, usage=None))
+	return llm
+
+
+@pytest.mark.parametrize('last_step', [False, True])
+async def test_plan_is_inserted_before_state_message(last_step):
+	agent, sent = _agent_with_stubbed_step(_planner_llm('the plan'))
+	step_info = AgentStepInfo(step_number=4, max_steps=5) if last_step else AgentStepInfo(step_number=0, max_steps=5)
+
+	await agent.step(step_info)
+
+	texts = [m.text for m in sent[0]]
+	state_at = texts.index('STATE')
+	assert isinstance(sent[0][state_at - 1], AssistantMessage)
+	assert texts[state_at - 1] == 'the plan'
+	if last_step:
+		assert 'Now comes your last step' in texts[state_at + 1]
+	else:
+		assert state_at == len(texts) - 1
+
+
+async def test_planner_failure_does_not_fail_step():
+	planner_llm = create_mock_llm()
+	planner_llm.ainvoke = AsyncMock(side_effect=RuntimeError('planner down'))
+	agent, sent = _agent_with_stubbed_step(planner_llm)
+
+	await agent.step(AgentStepInfo(step_number=0, max_steps=5))
+
+	assert len(sent) == 1
+	assert sent[0][-1].text == 'STATE'
+	assert agent.state.consecutive_failures == 0
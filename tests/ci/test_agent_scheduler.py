@@ -0,0 +1,35 @@
+from agentic_os.kernel.scheduler import AgentScheduler
+
+
+async def _agent(name: str, steps: int):
+	for i in range(steps):
+		yield f'{name}{i}'
+
+
+async def _collect(scheduler: AgentScheduler) -> list[tuple[str, str]]:
+	return [step async for step in scheduler.run()]
+
+
+async def test_fifo_runs_agents_to_completion_in_order():
+	scheduler = AgentScheduler('fifo')
+	scheduler.register_agent('a', _agent('a', 2))
+	scheduler.register_agent('b', _agent('b', 1))
+
+	assert await _collect(scheduler) == [('a', 'a0'), ('a', 'a1'), ('b', 'b0')]
+	assert not scheduler.has_agents
+
+
+async def test_round_robin_interleaves_agents():
+	scheduler = AgentScheduler('round_robin')
+	scheduler.register_agent('a', _agent('a', 2))
+	scheduler.register_agent('b', _agent('b', 1))
+
+	assert await _collect(scheduler) == [('a', 'a0'), ('b', 'b0'), ('a', 'a1')]
+
+
+async def test_priority_runs_highest_priority_first():
+	scheduler = AgentScheduler('priority')
+	scheduler.register_agent('low', _agent('low', 1), priority=0)
+	scheduler.register_agent('high', _agent('high', 1), priority=5)
+
+	assert await _collect(scheduler) == [('high', 'high0'), ('low', 'low0')]
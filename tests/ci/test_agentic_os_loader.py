@@ -1,5 +1,7 @@
 """Tests for agentic OS configuration loader."""
 
+import os
+
 from browser_use.agentic_os import load_agentic_os_config
 
 
@@ -17,3 +19,53 @@ class TestAgenticOSLoader:
 	    monkeypatch.setenv("AGENTIC_OS_CONFIG", str(cfg))
 	    loaded = load_agentic_os_config()
 	    assert loaded.toolhub_endpoint == "http://x.com"
+
+	def test_reload_after_edit_and_json(self, tmp_path):
+	    cfg = tmp_path / "cfg.yaml"
+	    cfg.write_text("planner_model: foo\n")
+	    first = load_agentic_os_config(cfg)
+	    assert first.planner_model == "foo"
+	    assert load_agentic_os_config(cfg) is first
+
+	    cfg.write_text("planner_model: bar\n")
+	    os.utime(cfg, ns=(1, 1))
+	    assert load_agentic_os_config(cfg).planner_model == "bar"
+
+	    cfg_json = tmp_path / "cfg.json"
+	    cfg_json.write_text('{"memory_backend": "faiss"}')
+	    assert load_agentic_os_config(cfg_json).memory_backend == "faiss"
+
+	def test_yaml_json_sidecar_cache(self, tmp_path, monkeypatch):
+	    from browser_use import agentic_os
+
+	    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+	    cfg = tmp_path / "cfg.yaml"
+	    cfg.write_text("memory_backend: bar\n")
+	    load_agentic_os_config(cfg)
+	    # the sidecar goes to the user cache dir, not next to the config file
+	    assert sorted(p.name for p in tmp_path.iterdir()) == ["cache", "cfg.yaml"]
+	    sidecar = agentic_os._json_cache_path(cfg)
+	    assert sidecar.is_file() and sidecar.is_relative_to(tmp_path / "cache")
+
+	    # a fresh process (empty in-memory cache) reads the sidecar instead of the YAML
+	    agentic_os._config_cache.clear()
+	    sidecar.write_text(sidecar.read_text().replace('"bar"', '"from-cache"'))
+	    assert load_agentic_os_config(cfg).memory_backend == "from-cache"
+
+	def test_malformed_sidecar_is_ignored(self, tmp_path, monkeypatch):
+	    import json
+
+	    from browser_use import agentic_os
+
+	    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+	    cfg = tmp_path / "cfg.yaml"
+	    cfg.write_text("memory_backend: bar\n")
+	    st = cfg.stat()
+	    sidecar = agentic_os._json_cache_path(cfg)
+	    sidecar.parent.mkdir(parents=True)
+	    stamp = {"mtime_ns": st.st_mtime_ns, "size": st.st_size}
+	    for payload in (stamp, {**stamp, "data": []}, {**stamp, "data": {"planner_model": 123}}):
+	        agentic_os._config_cache.clear()
+	        sidecar.write_text(json.dumps(payload))
+	        config = load_agentic_os_config(cfg)
+	        assert config.memory_backend == "bar" and config.planner_model is None
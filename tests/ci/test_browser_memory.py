@@ -1,6 +1,9 @@
+from types import SimpleNamespace
+
 import pytest
 
-from browser_use.agent.memory_adapter import BrowserMemory
+import browser_use.agent.memory_adapter as memory_adapter
+from browser_use.agent.memory_adapter import BrowserMemory, initialize_memory, maybe_create_procedural_memory
 
 
 class TestBrowserMemory:
@@ -19,3 +22,69 @@ class TestBrowserMemory:
         snap = await mem.snapshot()
         assert len(snap) == 1
         assert snap[0].text == 'a'
+
+    async def test_maxlen_evicts_oldest(self):
+        mem = BrowserMemory(maxlen=2)
+        for text in ('a', 'b', 'c'):
+            await mem.store(text)
+        assert [e.text for e in await mem.retrieve()] == ['b', 'c']
+        assert [e.text for e in await mem.retrieve(limit=5)] == ['b', 'c']
+
+    async def test_store_many(self):
+        mem = BrowserMemory(maxlen=3)
+        await mem.store('a')
+        await mem.store_many(t for t in ('b', 'c', 'd'))
+        entries = await mem.retrieve()
+        assert [e.text for e in entries] == ['b', 'c', 'd']
+        assert entries[1].timestamp == entries[2].timestamp
+
+
+class _StubMemory:
+    def __init__(self, message_manager, llm, config):
+        self.config = config
+        self.created: list[int] = []
+
+    def create_procedural_memory(self, n_steps: int) -> None:
+        self.created.append(n_steps)
+
+
+class TestProceduralMemoryInterval:
+    @pytest.fixture
+    def make_agent(self, monkeypatch):
+        monkeypatch.setattr(memory_adapter, 'Memory', _StubMemory)
+
+        def make(n_steps: int = 1, interval: int = 3):
+            agent = SimpleNamespace(
+                enable_memory=True,
+                _message_manager=None,
+                llm=None,
+                memory_config=SimpleNamespace(memory_interval=interval),
+                state=SimpleNamespace(n_steps=n_steps),
+                logger=None,
+            )
+            initialize_memory(agent)
+            return agent
+
+        return make
+
+    def _run_steps(self, agent, steps):
+        for n in steps:
+            agent.state.n_steps = n
+            maybe_create_procedural_memory(agent)
+        return agent.memory.created
+
+    def test_fires_on_interval_boundaries(self, make_agent):
+        assert self._run_steps(make_agent(), range(1, 11)) == [3, 6, 9]
+
+    def test_retried_step_fires_once(self, make_agent):
+        assert self._run_steps(make_agent(), [1, 2, 3, 3, 3, 4, 5, 6, 6]) == [3, 6]
+
+    def test_resumed_n_steps(self, make_agent):
+        # injected state resuming mid-run and exactly on a boundary
+        assert self._run_steps(make_agent(n_steps=5), range(5, 10)) == [6, 9]
+        assert self._run_steps(make_agent(n_steps=6), range(6, 10)) == [6, 9]
+
+    def test_disabled_memory_never_fires(self, make_agent):
+        agent = make_agent()
+        agent.enable_memory = False
+        assert self._run_steps(agent, range(1, 7)) == []
@@ -0,0 +1,129 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+from browser_use.agent.planning import BatchingPlanner, BrowserPlanner, PlannerContext, _remove_think_tags
+from browser_use.llm.base import BaseChatModel
+from browser_use.llm.messages import ContentPartImageParam, ContentPartTextParam, ImageURL, UserMessage
+from browser_use.llm.views import ChatInvokeCompletion
+
+
+def _planner_llm(completion: str) -> AsyncMock:
+	llm = AsyncMock(spec=BaseChatModel)
+	llm.model = 'mock-planner'
+	llm.ainvoke.return_value = ChatInvokeCompletion(completion=completion, usage=None)
+	return llm
+
+
+async def test_generate_plan_parses_json():
+	llm = _planner_llm('{"next_steps": "click the button"}')
+	planner = BrowserPlanner(llm)
+
+	plan = await planner.generate_plan('task', context=PlannerContext(llm=llm))
+
+	assert plan.next_steps == 'click the button'
+	assert plan.raw == '{"next_steps": "click the button"}'
+
+
+async def test_plan_cache_skips_llm_on_repeat():
+	llm = _planner_llm('{"next_steps": "scroll"}')
+	planner = BrowserPlanner(llm)
+	cache = {}
+	context = PlannerContext(llm=llm, messages=[UserMessage(content='state 1')], plan_cache=cache)
+
+	first = await planner.generate_plan('task', context=context)
+	second = await planner.generate_plan('task', context=context)
+	assert second is first
+	assert llm.ainvoke.await_count == 1
+	assert len(cache) == 1
+
+	context.messages = [UserMessage(content='state 2')]
+	await planner.generate_plan('task', context=context)
+	assert llm.ainvoke.await_count == 2
+
+
+async def test_images_stripped_when_planner_vision_disabled():
+	llm = _planner_llm('plain text plan')
+	planner = BrowserPlanner(llm)
+	state = UserMessage(
+		content=[
+			ContentPartTextParam(text='page '),
+			ContentPartImageParam(image_url=ImageURL(url='data:image/png;base64,AAAA')),
+			ContentPartTextParam(text='state'),
+		]
+	)
+	context = PlannerContext(llm=llm, messages=[state], use_vision=True, use_vision_for_planner=False)
+
+	plan = await planner.generate_plan('task', context=context)
+
+	assert plan.raw == 'plain text plan'
+	sent = llm.ainvoke.await_args.args[0]
+	assert sent[-1].content == 'page state'
+
+
+async def test_batching_planner_coalesces_concurrent_calls():
+	llm = _planner_llm('{}')
+	llm.ainvoke.side_effect = lambda messages: ChatInvokeCompletion(completion=messages[-1].text, usage=None)
+	batcher = BatchingPlanner.for_llm(llm, window_ms=5)
+	assert BatchingPlanner.for_llm(llm, window_ms=5) is batcher
+	assert BatchingPlanner.for_llm(llm, window_ms=20).window_ms == 20
+
+	results = await asyncio.gather(
+		batcher.invoke([UserMessage(content='plan a')]),
+		batcher.invoke([UserMessage(content='plan b')]),
+	)
+
+	assert results == ['plan a', 'plan b']
+	assert llm.ainvoke.await_count == 2
+
+
+async def test_batching_planner_does_not_wait_on_running_calls():
+	loop = asyncio.get_running_loop()
+	started: dict[str, float] = {}
+
+	async def ainvoke(messages):
+		text = messages[-1].text
+		started[text] = loop.time()
+		if text == 'slow':
+			await asyncio.sleep(0.5)
+		return ChatInvokeCompletion(completion=text, usage=None)
+
+	llm = _planner_llm('{}')
+	llm.ainvoke.side_effect = ainvoke
+	batcher = BatchingPlanner(llm, window_ms=5)
+
+	slow = asyncio.create_task(batcher.invoke([UserMessage(content='slow')]))
+	await asyncio.sleep(0.05)
+	assert await batcher.invoke([UserMessage(content='fast')]) == 'fast'
+
+	# the second call ran while the first was still in flight
+	assert not slow.done()
+	assert started['fast'] - started['slow'] < 0.2
+	assert await slow == 'slow'
+
+
+def test_remove_think_tags():
+	assert _remove_think_tags('  plan  ') == 'plan'
+	assert _remove_think_tags('<think>a</think>plan<think>b</think>') == 'plan'
+	assert _remove_think_tags('reasoning</think> plan') == 'plan'
+	assert _remove_think_tags('<think>a</think>x</think>plan <think>open') == 'plan <think>open'
+
+
+async def test_reasoning_model_output_is_stripped():
+	llm = _planner_llm('<think>hmm</think>{"next_steps": "go"}')
+	llm.model = 'deepseek-reasoner'
+	planner = BrowserPlanner(llm)
+
+	plan = await planner.generate_plan('task', context=PlannerContext(llm=llm))
+
+	assert plan.next_steps == 'go'
+
+
+async def test_plan_ignores_unknown_and_non_string_fields():
+	llm = _planner_llm('{"next_steps": ["a", "b"], "reasoning": "why", "extra": 1}')
+	planner = BrowserPlanner(llm)
+
+	plan = await planner.generate_plan('task', context=PlannerContext(llm=llm))
+
+	assert plan.reasoning == 'why'
+	assert plan.next_steps is None
+	assert not hasattr(plan, 'extra')
@@ -1,4 +1,6 @@
-from agentic_os.kernel.context import ContextManager
+import pytest
+
+from agentic_os.kernel.context import ContextManager, ContextSnapshot
 from browser_use.llm.messages import UserMessage
 
 
@@ -20,3 +22,61 @@ class TestContextManager:
 		msgs = [m.text for m in cm.get_messages()]
 		assert msgs == ['a b c']
 		assert cm.max_tokens == 5
+
+	def test_add_messages_batch(self):
+		cm = ContextManager(max_tokens=5)
+		cm.add_messages(
+			[
+				UserMessage(content='one two'),
+				UserMessage(content='three four five'),
+				UserMessage(content='six seven'),
+			]
+		)
+		msgs = [m.text for m in cm.get_messages()]
+		assert msgs == ['three four five', 'six seven']
+
+	def test_restore_from_serialized_snapshot(self):
+		cm = ContextManager(max_tokens=5)
+		cm.add_message(UserMessage(content='a b c'))
+		snap = ContextSnapshot.model_validate(cm.snapshot().model_dump())
+
+		restored = ContextManager()
+		restored.restore(snap)
+		assert restored.snapshot().current_tokens == cm.snapshot().current_tokens
+		restored.add_message(UserMessage(content='d e f'))
+		assert [m.text for m in restored.get_messages()] == ['d e f']
+
+	def test_counting_leaves_messages_untouched(self):
+		cm = ContextManager(max_tokens=50)
+		msg = UserMessage(content='a b c')
+		cm.add_message(msg)
+		assert msg == UserMessage(content='a b c')
+
+		# non-model messages go through the str() extractor
+		cm.add_message('plain string')  # type: ignore[arg-type]
+		assert cm.get_messages()[-1] == 'plain string'
+
+	def test_snapshot_reused_until_context_changes(self):
+		cm = ContextManager(max_tokens=50)
+		cm.add_message(UserMessage(content='a b c'))
+		snap = cm.snapshot()
+		assert cm.snapshot() is snap
+
+		cm.add_message(UserMessage(content='d e f'))
+		later = cm.snapshot()
+		assert later is not snap and len(later.messages) == 2
+
+		cm.restore(snap)
+		assert cm.snapshot() is snap
+
+	def test_whitespace_counting_by_default(self, monkeypatch):
+		import sys
+
+		# the default never imports tiktoken, so counts don't depend on what is installed
+		monkeypatch.setitem(sys.modules, 'tiktoken', None)
+		cm = ContextManager(max_tokens=50)
+		cm.add_message(UserMessage(content='one two three'))
+		assert cm.snapshot().current_tokens == 3
+
+		with pytest.raises(ImportError):
+			ContextManager(encoding='not-cached-encoding')
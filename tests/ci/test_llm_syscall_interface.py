@@ -1,6 +1,7 @@
+import asyncio
+
 from pydantic import BaseModel
 from pytest import raises
-from unittest.mock import AsyncMock
 
 from agentic_os.kernel.syscall import LLMSyscallInterface
 from agentic_os.tools import ToolSpec
@@ -10,41 +11,88 @@ class SimpleParams(BaseModel):
 	value: int
 
 
-async def test_invoke_llm_dispatch():
-	mock_llm = AsyncMock()
-	mock_llm.ainvoke.return_value = 'ok'
-	iface = LLMSyscallInterface(mock_llm, {})
+async def test_invoke_llm_dispatch(async_mock_llm):
+	async_mock_llm.ainvoke.return_value = 'ok'
+	iface = LLMSyscallInterface(async_mock_llm, {})
 
 	result = await iface.invoke_llm(['hello'])
 
 	assert result == 'ok'
-	mock_llm.ainvoke.assert_awaited_once_with(['hello'], None)
+	async_mock_llm.ainvoke.assert_awaited_once_with(['hello'], None)
 
 
-async def test_invoke_tool_dispatch():
+async def test_invoke_tool_dispatch(async_mock_llm):
 	async def tool(params: SimpleParams) -> int:
 		return params.value + 1
 
 	spec = ToolSpec('adder', 'add', SimpleParams, SimpleParams, tool)
-	iface = LLMSyscallInterface(AsyncMock(), {'adder': spec})
+	iface = LLMSyscallInterface(async_mock_llm, {'adder': spec})
 
 	result = await iface.invoke_tool('adder', {'value': 1})
 
 	assert result == 2
 
 
-async def test_invoke_tool_unknown():
-	iface = LLMSyscallInterface(AsyncMock(), {})
+async def test_invoke_tool_unknown(async_mock_llm):
+	iface = LLMSyscallInterface(async_mock_llm, {})
 	with raises(ValueError):
 		await iface.invoke_tool('missing', {})
 
 
-async def test_invoke_tool_validation_error():
+async def test_invoke_tool_validation_error(async_mock_llm):
 	async def tool(params: SimpleParams) -> int:
 		return params.value
 
 	spec = ToolSpec('echo', 'echo', SimpleParams, SimpleParams, tool)
-	iface = LLMSyscallInterface(AsyncMock(), {'echo': spec})
+	iface = LLMSyscallInterface(async_mock_llm, {'echo': spec})
 
 	with raises(Exception):
 		await iface.invoke_tool('echo', {'wrong': 1})
+
+
+async def test_invoke_llm_batches_concurrent_calls(async_mock_llm):
+	async def echo(messages, output_model):
+		return messages[0]
+
+	async_mock_llm.ainvoke.side_effect = echo
+	iface = LLMSyscallInterface(async_mock_llm, {}, batch_window_ms=5)
+
+	results = await asyncio.gather(iface.invoke_llm(['a']), iface.invoke_llm(['b']), iface.invoke_llm(['c']))
+
+	assert results == ['a', 'b', 'c']
+	assert async_mock_llm.ainvoke.await_count == 3
+
+
+async def test_invoke_tool_sees_tools_added_to_registry_later(async_mock_llm):
+	async def tool(params: SimpleParams) -> int:
+		return params.value
+
+	registry = {'noop': ToolSpec('noop', 'noop', SimpleParams, SimpleParams, tool)}
+	iface = LLMSyscallInterface(async_mock_llm, registry)
+	registry['echo'] = ToolSpec('echo', 'echo', SimpleParams, SimpleParams, tool)
+
+	assert await iface.invoke_tool('echo', {'value': 3}) == 3
+
+
+async def test_invoke_llm_batched_call_raising_cancelled_error_does_not_hang(async_mock_llm):
+	async_mock_llm.ainvoke.side_effect = asyncio.CancelledError()
+	iface = LLMSyscallInterface(async_mock_llm, {}, batch_window_ms=1)
+
+	with raises(asyncio.CancelledError):
+		await asyncio.wait_for(iface.invoke_llm(['a']), timeout=1)
+
+
+async def test_invoke_llm_batched_call_does_not_wait_on_running_calls(async_mock_llm):
+	async def ainvoke(messages, output_model):
+		if messages == ['slow']:
+			await asyncio.sleep(0.5)
+		return messages[0]
+
+	async_mock_llm.ainvoke.side_effect = ainvoke
+	iface = LLMSyscallInterface(async_mock_llm, {}, batch_window_ms=5)
+
+	slow = asyncio.create_task(iface.invoke_llm(['slow']))
+	await asyncio.sleep(0.05)
+	assert await asyncio.wait_for(iface.invoke_llm(['fast']), timeout=0.2) == 'fast'
+	assert not slow.done()
+	assert await slow == 'slow'
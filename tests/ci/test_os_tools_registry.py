@@ -1,9 +1,11 @@
 import browser_use.tools_os  # register OS specs
-from agentic_os import get_registry
+from agentic_os import get_registry, get_spec
 from browser_use.tools_os import (
     ShellCommandParams,
     FilePathParams,
     ManageProcessParams,
+    _read_capped,
+    read_file_bytes,
 )
 import pytest
 from pydantic import ValidationError
@@ -41,3 +43,85 @@ def test_os_tool_callable(tmp_path):
 def test_shell_command_validation():
     with pytest.raises(ValidationError):
         ShellCommandParams(command="echo hi; rm -rf /")
+
+
+def test_read_file_truncates_large_files(tmp_path):
+    read_file = get_registry()["read_os_file"].func
+    f = tmp_path / "big.log"
+    f.write_text("x" * 100)
+
+    result = read_file(FilePathParams(path=str(f), max_bytes=10))
+    assert result.extracted_content.startswith("x" * 10 + "\n")
+    assert "truncated: showing 10 of 100 bytes" in result.extracted_content
+
+
+def test_shell_command_runs_without_shell():
+    run_cmd = get_registry()["run_shell_command"].func
+
+    # quoted arguments survive shlex.split; no shell expands the glob
+    result = run_cmd(ShellCommandParams(command='echo "hello   world" *'))
+    assert result.extracted_content == "hello   world *\n"
+
+
+def test_shell_command_output_is_capped():
+    run_cmd = get_registry()["run_shell_command"].func
+
+    result = run_cmd(ShellCommandParams(command="echo 0123456789", max_output_bytes=4))
+    assert result.extracted_content.startswith("0123\n")
+    assert "truncated: showing 4 of 11 bytes" in result.extracted_content
+
+
+def test_get_spec_lookup():
+    assert get_spec("run_shell_command") is get_registry()["run_shell_command"]
+    assert get_spec("no_such_tool") is None
+
+
+def test_read_file_bytes(tmp_path):
+    payload = bytes(range(256)) * 1024
+    path = tmp_path / "blob.bin"
+    path.write_bytes(payload)
+
+    assert read_file_bytes(str(path)) == (payload, len(payload))
+    assert read_file_bytes(str(path), max_bytes=10) == (payload[:10], len(payload))
+
+
+def test_get_spec_runs_only_the_declaring_loader(monkeypatch):
+    import agentic_os.tools as agentic_tools
+
+    monkeypatch.setattr(agentic_tools, "_registry", {})
+    monkeypatch.setattr(agentic_tools, "_pending_loaders", [])
+    ran = []
+
+    def loader(tool_id):
+        def load():
+            ran.append(tool_id)
+            agentic_tools.register_spec(
+                agentic_tools.ToolSpec(tool_id, tool_id, ShellCommandParams, ShellCommandParams)
+            )
+
+        return load
+
+    agentic_tools.register_lazy(loader("first"), ids=("first",))
+    agentic_tools.register_lazy(loader("second"))
+    agentic_tools.register_lazy(loader("third"), ids=("third",))
+
+    assert get_spec("third").id == "third"
+    assert ran == ["third"]
+    assert get_spec("second").id == "second"
+    assert ran == ["third", "first", "second"]
+
+
+def test_trusted_params_match_validated(tmp_path):
+    f = tmp_path / "example.txt"
+    f.write_text("hello")
+
+    assert FilePathParams.trusted(path=str(f)) == FilePathParams(path=str(f))
+    run_cmd = get_registry()["run_shell_command"].func
+    assert run_cmd(ShellCommandParams.trusted(command="echo hi")).extracted_content == "hi\n"
+
+
+def test_read_capped_keeps_prefix_and_counts_the_rest():
+    import io
+
+    kept, total = _read_capped(io.BufferedReader(io.BytesIO(b"x" * 200_000)), 10)
+    assert kept == b"x" * 10 and total == 200_000
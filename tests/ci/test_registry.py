@@ -1242,3 +1242,46 @@ class TestParamsModelArgsAndKwargs:
 			# logger.info(f'Success with our fix! Result: {result3}')
 		except Exception as e:
 			logger.error(f'Error with our manual test: {str(e)}')
+
+
+class TestPromptDescriptionCache:
+	"""Test per-origin caching of page-specific action descriptions"""
+
+	async def test_page_description_cached_per_origin_and_invalidated_on_register(self):
+		registry = Registry()
+
+		class MockPage:
+			def __init__(self, url: str):
+				self.url = url
+
+		@registry.action('Search example', domains=['example.com'])
+		async def search_example(query: str):
+			return ActionResult()
+
+		first = registry.get_prompt_description(MockPage('https://example.com/a'))
+		assert 'search_example' in first
+		assert registry.get_prompt_description(MockPage('https://example.com/b')) == first
+		assert registry.get_prompt_description(MockPage('https://other.com/')) == ''
+
+		@registry.action('Only on checkout pages', page_filter=lambda page: page.url.endswith('/checkout'))
+		async def checkout(order_id: str):
+			return ActionResult()
+
+		assert 'checkout' not in registry.get_prompt_description(MockPage('https://example.com/a'))
+		assert 'checkout' in registry.get_prompt_description(MockPage('https://example.com/checkout'))
+
+	async def test_system_description_rebuilt_on_register(self):
+		registry = Registry()
+
+		@registry.action('First action')
+		async def first_action():
+			return ActionResult()
+
+		description = registry.get_prompt_description()
+		assert registry.get_prompt_description() is description
+
+		@registry.action('Second action')
+		async def second_action():
+			return ActionResult()
+
+		assert 'second_action' in registry.get_prompt_description()
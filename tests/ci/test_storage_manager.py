@@ -0,0 +1,33 @@
+from pytest import raises
+
+from agentic_os.kernel.storage import StorageManager
+
+
+async def test_roundtrip(tmp_path):
+	storage = StorageManager(tmp_path / 'store')
+	await storage.write_text('agent', 'notes.txt', 'hello')
+	await storage.write_bytes('agent', 'blob.bin', b'\x00\x01')
+
+	assert await storage.read_text('agent', 'notes.txt') == 'hello'
+	assert await storage.read_bytes('agent', 'blob.bin') == b'\x00\x01'
+
+
+async def test_rejects_paths_outside_base_dir(tmp_path):
+	storage = StorageManager(tmp_path / 'store')
+	(tmp_path / 'store2').mkdir()
+
+	# a sibling directory sharing the base dir's name as a prefix must not pass the containment check
+	with raises(ValueError):
+		await storage.write_text('../store2', 'x.txt', 'nope')
+	with raises(ValueError):
+		await storage.read_text('agent', '../../outside.txt')
+
+
+def test_large_file_threshold_counts_utf8_bytes():
+	from agentic_os.kernel.storage import _utf8_size_below
+
+	assert _utf8_size_below('a' * 999, 1000)
+	assert not _utf8_size_below('a' * 1000, 1000)
+	# 300 four-byte characters are 1200 bytes despite a length of 300
+	assert not _utf8_size_below('\U0001f600' * 300, 1000)
+	assert _utf8_size_below('\U0001f600' * 249, 1000)
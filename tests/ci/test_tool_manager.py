@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 from pytest import raises
 
 from agentic_os.kernel.tool import ToolManager
@@ -31,3 +31,48 @@ async def test_conflict_detection():
 	spec2 = ToolSpec("t", "desc", Params, Params, other)
 	with raises(ValueError):
 		mgr.register(spec2)
+
+
+async def test_execute_validates_params():
+	spec = ToolSpec("adder", "add one", Params, Params, add_one)
+	mgr = ToolManager([spec])
+
+	with raises(ValidationError):
+		await mgr.execute("adder", {"value": "not a number"})
+	assert await mgr.execute("adder", {"value": "2"}) == 3
+
+
+async def test_execute_by_index_after_register():
+	mgr = ToolManager([ToolSpec("adder", "add one", Params, Params, add_one)])
+	adder = mgr.index("adder")
+	assert await mgr.execute_by_index(adder, {"value": 1}) == 2
+
+	async def double(params: Params) -> int:
+		return params.value * 2
+
+	mgr.register(ToolSpec("double", "double", Params, Params, double))
+	assert await mgr.execute_by_index(mgr.index("double"), {"value": 4}) == 8
+	assert await mgr.execute_by_index(adder, {"value": 4}) == 5
+
+
+def test_tool_spec_has_no_instance_dict():
+	spec = ToolSpec("adder", "add one", Params, Params, add_one)
+	assert not hasattr(spec, "__dict__")
+	assert spec == ToolSpec("adder", "add one", Params, Params, add_one)
+
+
+async def test_register_many_is_all_or_nothing():
+	async def other(params: Params) -> int:
+		return params.value
+
+	mgr = ToolManager([ToolSpec("a", "desc", Params, Params, add_one), ToolSpec("b", "desc", Params, Params, add_one)])
+	with raises(ValueError, match="a, b"):
+		mgr.register_many(
+			[
+				ToolSpec("a", "desc", Params, Params, other),
+				ToolSpec("b", "desc", Params, Params, other),
+				ToolSpec("c", "desc", Params, Params, other),
+			]
+		)
+	with raises(KeyError):
+		mgr.get("c")
@@ -6,3 +6,15 @@ def test_tool_spec_functions_registered():
 	registry = get_registry()
 	assert registry
 	assert all(callable(spec.func) for spec in registry.values())
+
+
+def test_tool_spec_functions_match_ids(monkeypatch):
+	import agentic_os.tools as agentic_tools
+
+	# register only the browser specs, so OS tools with their own naming are not mixed in
+	monkeypatch.setattr(agentic_tools, '_registry', {})
+	browser_use.tools._register_all()
+	registry = agentic_tools._registry
+	assert 'clear_cell_contents' in registry
+	mismatched = {tool_id: spec.func.__name__ for tool_id, spec in registry.items() if spec.func.__name__ != tool_id}
+	assert not mismatched